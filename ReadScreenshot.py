@@ -23,12 +23,22 @@ valid_extensions = config.VALID_EXTENSIONS
 # Create extracted folder if it doesn't exist
 os.makedirs(extracted_folder, exist_ok=True)
 
+# Shared pool for the independent per-region OCR calls inside a screenshot.
+# Tesseract runs outside the GIL (subprocess or tesserocr), so the map,
+# game-length and hero extractions overlap cleanly.
+_region_executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
 
+def _connect_db():
+    """Connect to the configured database (plain path or file: URI)"""
+    return sqlite3.connect(config.DATABASE_NAME,
+                           uri=config.DATABASE_NAME.startswith('file:'))
+
 def init_database():
     """Initialize the SQLite database with proper schema"""
-    conn = sqlite3.connect(config.DATABASE_NAME)
+    conn = _connect_db()
     c = conn.cursor()
 
     c.execute('''CREATE TABLE IF NOT EXISTS matches
@@ -47,11 +57,47 @@ def init_database():
                   FOREIGN KEY(match_id) REFERENCES matches(id),
                   UNIQUE(match_id, hero_name))''')
 
+    # Indexes backing the stats queries: without them the date filters, the
+    # hero/map-specific reports and the per-match hero join fall back to
+    # full table scans
+    c.execute('CREATE INDEX IF NOT EXISTS idx_matches_date ON matches(date)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_matches_map_date ON matches(map, date)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_match_heroes_match ON match_heroes(match_id)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_match_heroes_hero ON match_heroes(hero_name)')
+
     conn.commit()
     conn.close()
 
-def save_match(date: str, map_name: str, result: str, length_sec: int, hero_data: List[Dict[str, Any]]) -> bool:
-    """Save match data to database with percentage validation"""
+def _insert_match(conn: sqlite3.Connection, utc_date_str: str, map_name: str, result: str,
+                  length_sec: int, hero_data: List[Dict[str, Any]]) -> bool:
+    """Insert one match and its heroes on an existing connection"""
+    c = conn.cursor()
+    c.execute('''INSERT OR IGNORE INTO matches 
+                 (date, map, result, length_sec)
+                 VALUES (?,?,?,?)''',
+              (utc_date_str, map_name, result, length_sec))
+
+    if c.rowcount == 0:
+        return False
+
+    match_id = c.lastrowid
+
+    # Batch insert heroes for better performance
+    hero_values = [(match_id, hero['hero'], hero['percentage']) for hero in hero_data]
+    c.executemany('''INSERT OR IGNORE INTO match_heroes
+                     (match_id, hero_name, play_percentage)
+                     VALUES (?,?,?)''',
+                  hero_values)
+    return True
+
+def save_match(date: str, map_name: str, result: str, length_sec: int, hero_data: List[Dict[str, Any]],
+               conn: Optional[sqlite3.Connection] = None) -> bool:
+    """Save match data to database with percentage validation.
+
+    When conn is provided the insert joins the caller's transaction (one
+    commit/fsync for a whole batch); otherwise a short-lived connection is
+    opened and committed per match.
+    """
     if not hero_data:
         logging.warning("No hero data to save.")
         return False
@@ -71,68 +117,94 @@ def save_match(date: str, map_name: str, result: str, length_sec: int, hero_data
         return False
 
     try:
-        with sqlite3.connect(config.DATABASE_NAME) as conn:
-            c = conn.cursor()
-            c.execute('''INSERT OR IGNORE INTO matches 
-                         (date, map, result, length_sec)
-                         VALUES (?,?,?,?)''',
-                      (utc_date_str, map_name, result, length_sec))
-
-            if c.rowcount > 0:
-                match_id = c.lastrowid
-
-                # Batch insert heroes for better performance
-                hero_values = [(match_id, hero['hero'], hero['percentage']) for hero in hero_data]
-                c.executemany('''INSERT OR IGNORE INTO match_heroes
-                                 (match_id, hero_name, play_percentage)
-                                 VALUES (?,?,?)''',
-                              hero_values)
-
-                conn.commit()
+        if conn is not None:
+            # Caller owns the connection and the enclosing transaction
+            return _insert_match(conn, utc_date_str, map_name, result, length_sec, hero_data)
+
+        with _connect_db() as own_conn:
+            if _insert_match(own_conn, utc_date_str, map_name, result, length_sec, hero_data):
+                own_conn.commit()
                 return True
             return False
     except sqlite3.Error as e:
         logging.error(f"Database error: {e}")
         return False
 
-def process_single_file(file_path: Path, extracted_folder: Path) -> tuple[bool, str]:
-    """Process a single screenshot file with proper error handling and resource management"""
+def extract_match_data(file_path: Path) -> Optional[Dict[str, Any]]:
+    """OCR one screenshot and return its match fields, without touching the
+    database. Returns None when any required field could not be read."""
+    with Image.open(file_path) as image:
+        image.load()  # 🔧 Force full load into memory (prevents file lock issues)
+
+        # Tesseract cost scales with pixel count, so shrink oversized
+        # captures (e.g. 4K) to the reference width before any OCR. The
+        # region math keys off the actual dimensions, so coordinates
+        # stay correct at the reduced size.
+        if image.width > REFERENCE_WIDTH:
+            scaled_height = round(image.height * REFERENCE_WIDTH / image.width)
+            image = image.resize((REFERENCE_WIDTH, scaled_height), Image.Resampling.LANCZOS)
+
+        # Extract all required data
+        text = pytesseract.image_to_string(image)
+
+        # All region extractors work on grayscale, so convert the full
+        # frame once instead of re-converting every crop
+        gray = image.convert('L')
+
+        # The region OCRs are independent, so run them concurrently
+        length_future = _region_executor.submit(extract_game_length, gray, text)
+        map_future = _region_executor.submit(
+            extract_map_name, gray, OVERWATCH_MAPS, MAP_CORRECTIONS, config.TESSERACT_CONFIG,
+            full_text=text)
+        hero_future = _region_executor.submit(extract_hero_data, gray, file_path.name)
+
+        game_result = determine_result(text)
+        game_datetime = extract_datetime(text, config.DATE_INPUT_FORMAT, config.DATE_OUTPUT_FORMAT)
+        game_length_sec, _, _ = length_future.result()
+        game_map = map_future.result()
+        hero_data = hero_future.result()
+
+        # Validate all required fields
+        if (game_length_sec is None or
+            game_result is None or
+            game_datetime is None or
+            game_map is None or
+            hero_data is None):
+            logging.warning(f"Could not read all data from: {file_path.name}")
+            return None
+
+        return {
+            'date': game_datetime,
+            'map_name': game_map,
+            'result': game_result,
+            'length_sec': game_length_sec,
+            'hero_data': hero_data
+        }
+
+def process_single_file(file_path: Path, extracted_folder: Path, move: bool = True,
+                        conn: Optional[sqlite3.Connection] = None) -> tuple[bool, str]:
+    """Process a single screenshot file with proper error handling and resource management.
+
+    With move=False the file is read and ingested but left in place, which
+    lets the tests run against the checked-in screenshots without a
+    move-back step. A caller-supplied conn batches the insert into the
+    caller's transaction.
+    """
     try:
-        with Image.open(file_path) as image:
-            image.load()  # 🔧 Force full load into memory (prevents file lock issues)
-            # Extract all required data
-            text = pytesseract.image_to_string(image)
-            
-            game_length_sec, _, _ = extract_game_length(image, text)
-            game_result = determine_result(text)
-            game_datetime = extract_datetime(text, config.DATE_INPUT_FORMAT, config.DATE_OUTPUT_FORMAT)
-            game_map = extract_map_name(image, OVERWATCH_MAPS, MAP_CORRECTIONS, config.TESSERACT_CONFIG)
-            hero_data = extract_hero_data(image, file_path.name)
-
-            # Validate all required fields
-            if (game_length_sec is None or 
-                game_result is None or 
-                game_datetime is None or 
-                game_map is None or 
-                hero_data is None):
-                logging.warning(f"Could not read all data from: {file_path.name}")
-                return False, file_path.name
-
-            # Save to database
-            if save_match(
-                date=game_datetime,  # type: ignore
-                map_name=game_map,  # type: ignore
-                result=game_result,  # type: ignore
-                length_sec=game_length_sec,  # type: ignore
-                hero_data=hero_data  # type: ignore
-            ):
+        match_data = extract_match_data(file_path)
+        if match_data is None:
+            return False, file_path.name
+
+        # Save to database
+        if save_match(conn=conn, **match_data):
+            if move:
                 dest_path = extracted_folder / file_path.name
                 file_path.rename(dest_path)
-                logging.info(f"Successfully processed: {file_path.name}")
-                return True, file_path.name
-            else:
-                logging.info(f"Skipped duplicate: {file_path.name}")
-                return False, file_path.name
+            logging.info(f"Successfully processed: {file_path.name}")
+            return True, file_path.name
+        else:
+            logging.info(f"Skipped duplicate: {file_path.name}")
+            return False, file_path.name
 
     except Exception as e:
         logging.error(f"Error processing {file_path.name}: {str(e)}")
@@ -168,10 +240,11 @@ def process_screenshots(progress_callback: Optional[Callable[[int, int], None]]
     processed_files = 0
     error_files = 0
 
-    # Determine optimal number of workers (leave some CPU headroom)
-    max_workers = min(4, (os.cpu_count() or 1))
-    if max_workers < 1:
-        max_workers = 1
+    # Determine optimal number of workers. Threads are the right pool here:
+    # the OCR work already runs outside the GIL (tesseract subprocess or
+    # tesserocr C call), so processes would only add pickling and a second
+    # copy of the engine per worker without buying extra parallelism.
+    max_workers = min(8, os.cpu_count() or 1)
 
     logging.info(f"Starting parallel processing with {max_workers} workers...")
 
@@ -7,7 +7,9 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-# Timezone configuration - automatically detect system timezone
+# Timezone configuration - automatically detect system timezone.
+# Detected once at import; local_to_utc/utc_to_local reuse these singletons so
+# per-call conversions never re-run tzlocal detection or construct tzinfo objects.
 try:
     LOCAL_TIMEZONE = ZoneInfo(str(tzlocal.get_localzone()))
 except Exception as e:
@@ -69,9 +69,10 @@ GAME_MODES = {
     ]
 }
 
+# Inverse lookup built once at import; callers previously rebuilt this dict
+# (or scanned GAME_MODES) per call
+MAP_MODES = {map_name: mode for mode, maps in GAME_MODES.items() for map_name in maps}
+
 def get_map_mode(map_name):
     """Get game mode for a specific map"""
-    for mode, maps in GAME_MODES.items():
-        if map_name in maps:
-            return mode
-    return None
\ No newline at end of file
+    return MAP_MODES.get(map_name)
\ No newline at end of file
@@ -18,18 +18,87 @@ from ReadScreenshot import process_screenshots
 import config
 from datetime import datetime
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.colors import Normalize
+from matplotlib.figure import Figure
 import json
 import os
+import re
 from pathlib import Path
 from heros import OVERWATCH_HEROES
 from map_categories import OVERWATCH_MAPS
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
 
+# Hero/map lists are static, so sort them once at import instead of rebuilding
+# and re-sorting on every dialog open. Tuples are the cheapest form for
+# Tkinter's sequence-to-Tcl-list conversion when comboboxes reuse them.
+SORTED_HEROES = tuple(sorted(hero for role in OVERWATCH_HEROES.values() for hero in role))
+SORTED_MAPS = tuple(sorted(OVERWATCH_MAPS))
+
+# Shared gradient assets for every chart render; the registry lookup and
+# ScalarMappable construction only need to happen once
+_CHART_CMAP = plt.get_cmap('RdYlGn')  # Red-Yellow-Green colormap
+_CHART_NORM = Normalize(0, 100)
+_CHART_SM = plt.cm.ScalarMappable(cmap=_CHART_CMAP, norm=_CHART_NORM)
+_CHART_SM.set_array([])
+
+
+# Precompiled fast path for the default 'YYYY-MM-DD HH:MM' entry format;
+# datetime.strptime re-walks the format string on every call
+_DATE_ENTRY_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2})$')
+
+# Strict MM:SS match length; validates and tokenizes in one scan
+_MATCH_LENGTH_RE = re.compile(r'\s*(\d+):(\d+)\s*$')
+
+
+def _parse_entry_date(date_str):
+    """Parse a user-entered local date string per config.DATE_OUTPUT_FORMAT.
+
+    Uses a compiled regex when the format is the default one; on a regex
+    miss (or a custom format) the call falls through to strptime, which
+    also accepts non-zero-padded components and raises ValueError for
+    genuinely invalid input. The fast path is purely an optimization.
+    """
+    if config.DATE_OUTPUT_FORMAT == '%Y-%m-%d %H:%M':
+        match = _DATE_ENTRY_RE.match(date_str.strip())
+        if match:
+            return datetime(*map(int, match.groups()))
+    return datetime.strptime(date_str, config.DATE_OUTPUT_FORMAT)
+
+
+# Splits a table row on '|' and trims the surrounding whitespace in one
+# C-level pass, replacing the split + per-cell strip list comprehension
+_TABLE_CELL_SEP_RE = re.compile(r'\s*\|\s*')
+
+
+def _parse_table(text, min_cols):
+    """Parse a pipe-delimited results table into rows of stripped cells.
+
+    Skips separator lines and any line with fewer than min_cols columns;
+    header rows are filtered out by the callers' numeric coercion.
+    """
+    rows = []
+    for line in text.split('\n'):
+        if '|' not in line or line.startswith('-'):
+            continue
+        parts = _TABLE_CELL_SEP_RE.split(line.strip())
+        if len(parts) >= min_cols:
+            rows.append(parts)
+    return rows
+
+
+def _parse_percent(value):
+    """Convert a 'NN.N%' cell to a float, or None if it isn't numeric"""
+    try:
+        return float(value.replace('%', '').strip())
+    except ValueError:
+        return None
+
 
 def get_config_path():
     """Get path to user config file in standard location"""
@@ -87,6 +156,24 @@ class OverwatchStatsApp:
         self.figure_canvas = None
         self.clipboard_image = None
 
+        # Long-lived write connection, opened lazily on first use. All
+        # database work runs on the single-threaded executor below, which
+        # keeps the Tk event loop free and serializes access to the
+        # connection (hence check_same_thread=False is safe).
+        self._db_conn = None
+        self._db_conn_path = None
+        self._db_executor = ThreadPoolExecutor(max_workers=1)
+
+        # Pending after() ids for debounced callbacks, keyed by name
+        self._pending_after = {}
+
+        # Python-side copy of the last results write; chart parsers read this
+        # instead of serializing the whole Text buffer back out of Tk
+        self._last_text = ""
+        # Structured rows parsed out of the last results text, keyed by table
+        # kind; invalidated on every write so chart toggles reuse one parse
+        self._parsed_rows = {}
+
         # Load user settings if they exist
         user_settings = load_user_settings()  # Now calling the standalone function
         if user_settings:
@@ -115,11 +202,38 @@ class OverwatchStatsApp:
         self.current_figure = None
         plt.ioff()  # Turn off interactive mode to prevent figure conflicts
 
+    def _get_db_conn(self):
+        """Return the long-lived write connection, (re)opening it if needed.
+
+        Connection setup (schema parse, journal handling) dominates small
+        writes, so reuse one connection instead of reconnecting per save.
+        Reopens automatically if the configured database path changes.
+        """
+        if self._db_conn is None or self._db_conn_path != config.DATABASE_NAME:
+            if self._db_conn is not None:
+                self._db_conn.close()
+            self._db_conn = sqlite3.connect(config.DATABASE_NAME, check_same_thread=False)
+            self._db_conn.execute("PRAGMA journal_mode=WAL")
+            self._db_conn.execute("PRAGMA synchronous=NORMAL")
+            self._db_conn_path = config.DATABASE_NAME
+        return self._db_conn
+
+    def _debounce(self, key, ms, callback):
+        """Schedule callback after ms, cancelling any pending call for key.
+
+        Keeps per-keystroke/per-click handlers from re-running validation on
+        every event; only the last event in a burst fires.
+        """
+        pending = self._pending_after.pop(key, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._pending_after[key] = self.root.after(ms, callback)
+
     def on_close(self):
         """Handle window closing event"""
-        # Clean up any matplotlib figures
-        if hasattr(self, 'current_figure') and self.current_figure:
-            plt.close(self.current_figure)
+        self._db_executor.shutdown(wait=True)
+        if self._db_conn is not None:
+            self._db_conn.close()
         # Destroy the root window
         self.root.destroy()
 
@@ -315,14 +429,10 @@ class OverwatchStatsApp:
 
             if analysis_type == "Hero Map Win Rates":
                 self.selection_label.config(text="Select Hero:")
-                # Get all heroes from all roles
-                all_heroes = []
-                for role in OVERWATCH_HEROES.values():
-                    all_heroes.extend(role)
-                self.selection_combobox['values'] = sorted(all_heroes)
+                self.selection_combobox['values'] = SORTED_HEROES
             else:
                 self.selection_label.config(text="Select Map:")
-                self.selection_combobox['values'] = sorted(OVERWATCH_MAPS)
+                self.selection_combobox['values'] = SORTED_MAPS
 
             if self.selection_combobox['values']:
                 self.selection_combobox.current(0)
@@ -570,6 +680,22 @@ class OverwatchStatsApp:
         except ValueError:
             return False
 
+    def _set_results(self, text, tag=None):
+        """Replace the results view contents in a single buffered write.
+
+        Every insert makes Tk re-layout and reflow the widget, so callers
+        build their full output first and hand it over in one call. The text
+        is also cached on the Python side for the chart parsers.
+        """
+        self._last_text = text
+        self._parsed_rows = {}
+        self.results_text.delete(1.0, tk.END)
+        if text:
+            if tag:
+                self.results_text.insert(tk.END, text, tag)
+            else:
+                self.results_text.insert(tk.END, text)
+
     def run_analysis(self):
         """Execute the selected analysis and display results"""
         # Get user selections
@@ -609,7 +735,7 @@ class OverwatchStatsApp:
         min_matches = self.min_matches_var.get()
 
         # Clear previous results
-        self.results_text.delete(1.0, tk.END)
+        self._set_results("")
         self.status_var.set("Running analysis...")
         self.root.update()
 
@@ -642,7 +768,7 @@ class OverwatchStatsApp:
                 result = print_game_mode_stats_by_season(seasons, start_date, end_date)
 
             # Display the results
-            self.results_text.insert(tk.END, result)
+            self._set_results(result)
             self.status_var.set("Analysis complete")
 
             # Enable chart button for certain analysis types
@@ -654,14 +780,14 @@ class OverwatchStatsApp:
 
         except Exception as e:
             logging.error(f"Error in run_analysis: {e}")
-            self.results_text.insert(tk.END, f"Error: {str(e)}")
+            self._set_results(f"Error: {str(e)}")
             self.status_var.set("Error occurred")
 
     # In ow_stats_gui.py, modify the run_process_screenshots method:
     def run_process_screenshots(self):
         """Run the ReadScreenshot script and display results in the GUI"""
         try:
-            self.results_text.delete(1.0, tk.END)  # Clear previous results
+            self._set_results("")  # Clear previous results
             self.status_var.set("Processing screenshots... (0/?)")
             self.root.update()
 
@@ -675,7 +801,7 @@ class OverwatchStatsApp:
             if 'error' in stats:
                 # Display error message in red
                 self.results_text.tag_config('error', foreground='red')
-                self.results_text.insert(tk.END, str(stats['error']), 'error')
+                self._set_results(str(stats['error']), 'error')
                 self.status_var.set("Tesseract-OCR not found")
             else:
                 # Format the successful results
@@ -693,13 +819,13 @@ class OverwatchStatsApp:
                 else:
                     result_text += "Processed files moved to 'extracted' folder.\n"
 
-                self.results_text.insert(tk.END, result_text)
+                self._set_results(result_text)
                 self.status_var.set("Screenshot processing complete")
 
         except Exception as e:
             logging.error(f"Error processing screenshots: {e}")
             self.results_text.tag_config('error', foreground='red')
-            self.results_text.insert(tk.END, f"Unexpected error reading screenshots: {str(e)}\n", 'error')
+            self._set_results(f"Unexpected error reading screenshots: {str(e)}\n", 'error')
             self.status_var.set("Error processing screenshots")
 
     def delete_match(self):
@@ -734,7 +860,7 @@ class OverwatchStatsApp:
 
         try:
             # Parse as local time and convert to UTC
-            naive_time = datetime.strptime(date_str, config.DATE_OUTPUT_FORMAT)
+            naive_time = _parse_entry_date(date_str)
 
             # Use the new timezone conversion function
             utc_time = config.local_to_utc(naive_time)
@@ -742,15 +868,22 @@ class OverwatchStatsApp:
 
             if messagebox.askyesno("Confirm Delete",
                                    f"Are you sure you want to delete the match on {date_str} (local time)?"):
-                result = delete_match_by_date(utc_date_str)
-                messagebox.showinfo("Delete Result", result)
-                delete_window.destroy()
-                if self.analysis_var.get() == "All Matches":
-                    self.run_analysis()
+                # Run the delete off the Tk thread and marshal the result back
+                future = self._db_executor.submit(delete_match_by_date, utc_date_str)
+                future.add_done_callback(
+                    lambda f: self.root.after(0, self._on_delete_done, f, delete_window))
         except ValueError:
             messagebox.showerror("Input Error",
                                  f"Invalid date format. Please use {config.DATE_OUTPUT_FORMAT}")
 
+    def _on_delete_done(self, future, delete_window):
+        """Show the delete result on the UI thread once the worker finishes"""
+        result = future.result()
+        messagebox.showinfo("Delete Result", result)
+        delete_window.destroy()
+        if self.analysis_var.get() == "All Matches":
+            self.run_analysis()
+
     def add_match_manually(self):
         """Show dialog to add a match manually (input in local time, stored in UTC)"""
         manual_window = tk.Toplevel(self.root)
@@ -769,7 +902,7 @@ class OverwatchStatsApp:
         ttk.Label(manual_window, text="Map:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
         self.manual_map_var = tk.StringVar()
         map_combobox = ttk.Combobox(manual_window, textvariable=self.manual_map_var,
-                                    values=sorted(OVERWATCH_MAPS), state='readonly')
+                                    values=SORTED_MAPS, state='readonly')
         map_combobox.grid(row=1, column=1, padx=5, pady=5, sticky=tk.W)
 
         # Result
@@ -790,50 +923,53 @@ class OverwatchStatsApp:
         hero_frame = ttk.LabelFrame(manual_window, text="Heroes and Playtime Percentages", padding=10)
         hero_frame.grid(row=4, column=0, columnspan=2, padx=5, pady=5, sticky="we")
 
-        # Get all heroes from all roles
-        all_heroes = []
-        for role in OVERWATCH_HEROES.values():
-            all_heroes.extend(role)
-
         # Hero 1
         ttk.Label(hero_frame, text="Hero 1:").grid(row=0, column=0, padx=5, pady=2, sticky=tk.W)
         self.manual_hero1_var = tk.StringVar()
         hero1_combobox = ttk.Combobox(hero_frame, textvariable=self.manual_hero1_var,
-                                      values=sorted(all_heroes), state='readonly')
+                                      values=SORTED_HEROES, state='readonly')
         hero1_combobox.grid(row=0, column=1, padx=5, pady=2, sticky=tk.W)
 
         ttk.Label(hero_frame, text="%:").grid(row=0, column=2, padx=5, pady=2, sticky=tk.W)
         self.manual_percent1_var = tk.IntVar(value=0)
         percent1_spinbox = ttk.Spinbox(hero_frame, from_=0, to=100,
-                                       textvariable=self.manual_percent1_var, width=5)
+                                       textvariable=self.manual_percent1_var, width=5,
+                                       command=self._schedule_manual_total_update)
         percent1_spinbox.grid(row=0, column=3, padx=5, pady=2, sticky=tk.W)
 
         # Hero 2
         ttk.Label(hero_frame, text="Hero 2:").grid(row=1, column=0, padx=5, pady=2, sticky=tk.W)
         self.manual_hero2_var = tk.StringVar()
         hero2_combobox = ttk.Combobox(hero_frame, textvariable=self.manual_hero2_var,
-                                      values=sorted(all_heroes), state='readonly')
+                                      values=SORTED_HEROES, state='readonly')
         hero2_combobox.grid(row=1, column=1, padx=5, pady=2, sticky=tk.W)
 
         ttk.Label(hero_frame, text="%:").grid(row=1, column=2, padx=5, pady=2, sticky=tk.W)
         self.manual_percent2_var = tk.IntVar(value=0)
         percent2_spinbox = ttk.Spinbox(hero_frame, from_=0, to=100,
-                                       textvariable=self.manual_percent2_var, width=5)
+                                       textvariable=self.manual_percent2_var, width=5,
+                                       command=self._schedule_manual_total_update)
         percent2_spinbox.grid(row=1, column=3, padx=5, pady=2, sticky=tk.W)
 
         # Hero 3
         ttk.Label(hero_frame, text="Hero 3:").grid(row=2, column=0, padx=5, pady=2, sticky=tk.W)
         self.manual_hero3_var = tk.StringVar()
         hero3_combobox = ttk.Combobox(hero_frame, textvariable=self.manual_hero3_var,
-                                      values=sorted(all_heroes), state='readonly')
+                                      values=SORTED_HEROES, state='readonly')
         hero3_combobox.grid(row=2, column=1, padx=5, pady=2, sticky=tk.W)
 
         ttk.Label(hero_frame, text="%:").grid(row=2, column=2, padx=5, pady=2, sticky=tk.W)
         self.manual_percent3_var = tk.IntVar(value=0)
         percent3_spinbox = ttk.Spinbox(hero_frame, from_=0, to=100,
-                                       textvariable=self.manual_percent3_var, width=5)
+                                       textvariable=self.manual_percent3_var, width=5,
+                                       command=self._schedule_manual_total_update)
         percent3_spinbox.grid(row=2, column=3, padx=5, pady=2, sticky=tk.W)
 
+        # Running total of the three percentages, updated via debounce
+        self.manual_total_var = tk.StringVar(value="Total: 0%")
+        ttk.Label(hero_frame, textvariable=self.manual_total_var).grid(
+            row=3, column=0, columnspan=4, padx=5, pady=2, sticky=tk.W)
+
         # Buttons
         button_frame = ttk.Frame(manual_window)
         button_frame.grid(row=5, column=0, columnspan=2, pady=10, sticky="we")  # fix: sticky as string
@@ -843,13 +979,29 @@ class OverwatchStatsApp:
         ttk.Button(button_frame, text="Cancel",
                    command=manual_window.destroy).grid(row=0, column=1, padx=5)
 
+    def _schedule_manual_total_update(self):
+        """Debounce the percentage-total recompute while spinboxes change"""
+        self._debounce('manual_total', 150, self._update_manual_total)
+
+    def _update_manual_total(self):
+        """Refresh the running percentage total in the manual-add dialog"""
+        total = 0
+        for percent_var in (self.manual_percent1_var,
+                            self.manual_percent2_var,
+                            self.manual_percent3_var):
+            try:
+                total += percent_var.get()
+            except tk.TclError:
+                continue  # Entry may be empty or mid-edit
+        self.manual_total_var.set(f"Total: {total}%")
+
     def save_manual_match(self, window):
         """Save manually entered match data to database (converts local time to UTC)"""
         try:
             # Validate and convert date from local to UTC
             date_str = self.manual_date_var.get()
             try:
-                naive_time = datetime.strptime(date_str, config.DATE_OUTPUT_FORMAT)
+                naive_time = _parse_entry_date(date_str)
                 utc_time = config.local_to_utc(naive_time)
                 utc_date_str = utc_time.strftime(config.DATE_OUTPUT_FORMAT)
             except ValueError as e:
@@ -870,13 +1022,11 @@ class OverwatchStatsApp:
                 return
 
             # Validate length
-            length_str = self.manual_length_var.get()
-            try:
-                mins, secs = map(int, length_str.split(':'))
-                length_sec = mins * 60 + secs
-            except (ValueError, AttributeError):
+            length_match = _MATCH_LENGTH_RE.match(self.manual_length_var.get() or '')
+            if not length_match:
                 messagebox.showerror("Invalid Length", "Length must be in MM:SS format")
                 return
+            length_sec = int(length_match.group(1)) * 60 + int(length_match.group(2))
 
             # Validate heroes and percentages
             hero_data = []
@@ -910,42 +1060,57 @@ class OverwatchStatsApp:
                                      f"Total percentage cannot exceed 100% (current: {total_percent}%)")
                 return
 
-            # Save to database (using UTC time)
-            conn = sqlite3.connect(config.DATABASE_NAME)
-            c = conn.cursor()
-            try:
-                c.execute('''INSERT OR IGNORE INTO matches 
-                                     (date, map, result, length_sec)
-                                     VALUES (?,?,?,?)''',
-                          (utc_date_str, map_name, result, length_sec))
-
-                if c.rowcount > 0:
-                    match_id = c.lastrowid
-
-                    for hero in hero_data:
-                        c.execute('''INSERT OR IGNORE INTO match_heroes
-                                             (match_id, hero_name, play_percentage)
-                                             VALUES (?,?,?)''',
-                                  (match_id, hero['hero'], hero['percentage']))
-
-                    conn.commit()
-                    messagebox.showinfo("Success", "Match added successfully")
-                    window.destroy()
-
-                    # Refresh the display if we're showing matches
-                    if self.analysis_var.get() == "All Matatches":
-                        self.run_analysis()
-                else:
-                    messagebox.showerror("Error", "This match already exists in the database")
-
-            except sqlite3.Error as e:
-                messagebox.showerror("Database Error", f"Failed to save match: {str(e)}")
-            finally:
-                conn.close()
+            # Save to database (using UTC time) off the Tk thread
+            future = self._db_executor.submit(
+                self._insert_manual_match, utc_date_str, map_name, result, length_sec, hero_data)
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._on_manual_save_done, f, window))
 
         except Exception as e:
             messagebox.showerror("Error", f"An unexpected error occurred: {str(e)}")
 
+    def _insert_manual_match(self, utc_date_str, map_name, result, length_sec, hero_data):
+        """Insert a manually entered match; runs on the database worker thread"""
+        conn = self._get_db_conn()
+        c = conn.cursor()
+        c.execute('''INSERT OR IGNORE INTO matches
+                             (date, map, result, length_sec)
+                             VALUES (?,?,?,?)''',
+                  (utc_date_str, map_name, result, length_sec))
+
+        if c.rowcount == 0:
+            return False
+
+        match_id = c.lastrowid
+
+        # Batch insert heroes for better performance
+        c.executemany('''INSERT OR IGNORE INTO match_heroes
+                                 (match_id, hero_name, play_percentage)
+                                 VALUES (?,?,?)''',
+                      [(match_id, hero['hero'], hero['percentage'])
+                       for hero in hero_data])
+
+        conn.commit()
+        return True
+
+    def _on_manual_save_done(self, future, window):
+        """Report the manual-save result on the UI thread"""
+        try:
+            inserted = future.result()
+        except sqlite3.Error as e:
+            messagebox.showerror("Database Error", f"Failed to save match: {str(e)}")
+            return
+
+        if inserted:
+            messagebox.showinfo("Success", "Match added successfully")
+            window.destroy()
+
+            # Refresh the display if we're showing matches
+            if self.analysis_var.get() == "All Matches":
+                self.run_analysis()
+        else:
+            messagebox.showerror("Error", "This match already exists in the database")
+
     def export_results(self):
         """Export the current results to a text file"""
         content = self.results_text.get(1.0, tk.END)
@@ -974,46 +1139,55 @@ class OverwatchStatsApp:
         else:
             self.show_chart()
 
-    def show_chart(self):
-        """Display a chart based on the current analysis"""
-        # Ensure any previous figure is closed
-        if self.current_figure:
-            plt.close(self.current_figure)
-            self.current_figure = None
+    def _ensure_chart_canvas(self):
+        """Create the chart frame, figure and Tk canvas once, then reuse them.
 
-        # Destroy and recreate the chart frame to ensure clean slate
-        if self.chart_frame:
-            self.chart_frame.destroy()
+        Rebuilding the Agg canvas and Tk widgets on every chart toggle is the
+        expensive part of chart display; subsequent calls only clear and
+        repaint the existing figure.
+        """
+        if self.chart_frame is not None:
+            return
 
         self.chart_frame = ttk.Frame(self.main_frame)
         self.chart_frame.grid(row=0, column=2, rowspan=7, sticky="nse", padx=10)
 
+        self.current_figure = Figure(figsize=(10, 6))
+        self.figure_canvas = FigureCanvasTkAgg(self.current_figure, master=self.chart_frame)
+        canvas_widget = self.figure_canvas.get_tk_widget()
+        canvas_widget.pack(fill=tk.BOTH, expand=True)
+
+        # Add right-click context menu for copying
+        self.setup_chart_context_menu(canvas_widget)
+
+        # Add close button
+        self.create_chart_close_button(self.chart_frame)
+
+    def show_chart(self):
+        """Display a chart based on the current analysis"""
+        self._ensure_chart_canvas()
+        self.current_figure.clear()
+
         analysis_type = self.analysis_var.get()
 
         try:
+            fig = None
             if analysis_type == "Win Percentages by Map":
-                self.current_figure = self.create_win_percentage_chart()
+                fig = self.create_win_percentage_chart()
             elif analysis_type == "Hero Win Percentages":
-                self.current_figure = self.create_hero_win_percentage_chart()
+                fig = self.create_hero_win_percentage_chart()
             elif analysis_type == "Game Mode Stats":
-                self.current_figure = self.create_game_mode_chart()
+                fig = self.create_game_mode_chart()
             elif analysis_type == "Hero Map Win Rates":
-                self.current_figure = self.create_hero_map_chart()
+                fig = self.create_hero_map_chart()
             elif analysis_type == "Map Hero Win Rates":
-                self.current_figure = self.create_map_hero_chart()
-
-            if self.current_figure:
-                self.figure_canvas = FigureCanvasTkAgg(self.current_figure, master=self.chart_frame)
-                self.figure_canvas.draw()
-                canvas_widget = self.figure_canvas.get_tk_widget()
-                canvas_widget.pack(fill=tk.BOTH, expand=True)
-
-                # Add right-click context menu for copying
-                self.setup_chart_context_menu(canvas_widget)
-
-                # Add close button
-                self.create_chart_close_button(self.chart_frame)
+                fig = self.create_map_hero_chart()
 
+            if fig:
+                self.chart_frame.grid()
+                # draw_idle coalesces the render with other Tk idle tasks
+                # instead of blocking the event loop on a synchronous draw
+                self.figure_canvas.draw_idle()
                 self.chart_button.config(text="Hide Chart")
             else:
                 messagebox.showwarning("Chart Warning", "No chart data available")
@@ -1103,17 +1277,10 @@ class OverwatchStatsApp:
             self.status_var.set("Error copying chart")
 
     def hide_chart(self):
-        """Hide the chart frame"""
+        """Hide the chart frame, keeping the figure and canvas for reuse"""
         if self.chart_frame:
-            # Destroy all widgets in the frame
-            for widget in self.chart_frame.winfo_children():
-                widget.destroy()
             self.chart_frame.grid_remove()
 
-        if self.current_figure:
-            plt.close(self.current_figure)
-            self.current_figure = None
-
         self.chart_button.config(text="Show Chart")
 
     def create_chart_close_button(self, parent_frame):
@@ -1123,64 +1290,79 @@ class OverwatchStatsApp:
                                   style='Close.TButton')
         close_button.place(relx=1.0, x=-2, y=2, anchor="ne")
 
-    def create_win_percentage_chart(self):
-        """Create a bar chart for win percentages with gradient coloring and clear labels"""
-        # Extract data from the results text
-        lines = self.results_text.get(1.0, tk.END).split('\n')
-        data = []
+    _CHART_LABEL_BBOX = dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2')
 
-        for line in lines:
-            if '|' in line and not line.startswith('-') and not line.startswith('Map'):
-                parts = [p.strip() for p in line.split('|')]
-                if len(parts) >= 6:
-                    try:
-                        map_name = parts[0]
-                        win_percent_str = parts[-1].replace('%', '').strip()
-                        if win_percent_str.replace('.', '').isdigit():
-                            win_percent = float(win_percent_str)
-                            data.append((map_name, win_percent))
-                    except (ValueError, IndexError):
-                        continue
+    def _results_chart_text(self):
+        """Text the chart parsers read: the cached copy, or the widget as fallback"""
+        return self._last_text or self.results_text.get(1.0, tk.END)
 
-        if not data:
-            messagebox.showwarning("Chart Warning", "No valid win percentage data found in results.")
-            return None
+    def _parse_map_percent_rows(self):
+        """Extract (name, win%) rows from a map-style results table"""
+        cached = self._parsed_rows.get('map_percent')
+        if cached is not None:
+            return cached
 
-        # Prepare data for chart
-        data.sort(key=lambda x: x[1])
-        maps = [d[0] for d in data]
-        percentages = [d[1] for d in data]
+        data = []
+        for parts in _parse_table(self._results_chart_text(), 6):
+            win_percent = _parse_percent(parts[-1])
+            if win_percent is not None:
+                data.append((parts[0], win_percent))
+        self._parsed_rows['map_percent'] = data
+        return data
+
+    def _parse_weighted_hero_rows(self):
+        """Extract (hero, win%, weighted wins, weighted losses) rows"""
+        cached = self._parsed_rows.get('weighted_hero')
+        if cached is not None:
+            return cached
 
-        # Create figure with slightly larger width to accommodate labels
-        fig, ax = plt.subplots(figsize=(10, 6))
+        data = []
+        for parts in _parse_table(self._results_chart_text(), 5):
+            try:
+                weighted_wins = float(parts[2])
+                weighted_losses = float(parts[3])
+            except ValueError:
+                continue
+            win_percent = _parse_percent(parts[4])
+            if win_percent is not None and (weighted_wins + weighted_losses) > 0:
+                data.append((parts[0], win_percent, weighted_wins, weighted_losses))
+        self._parsed_rows['weighted_hero'] = data
+        return data
+
+    def _render_gradient_barh(self, names, percentages, bar_labels, title,
+                              height=6, label_y_offset=0.2, label_bbox=None):
+        """Render a gradient-colored horizontal bar chart into the shared figure.
+
+        All five analysis charts are the same plot apart from their data,
+        title, figure height and label decoration, so they funnel through
+        this one code path: colored barh, batched value labels, threshold
+        lines and the shared performance colorbar.
+        """
+        # Paint into the persistent figure (slightly larger width for labels)
+        fig = self.current_figure
+        fig.set_size_inches(10, height)
+        ax = fig.add_subplot(111)
 
         # Create color gradient from red to green
-        cmap = plt.get_cmap('RdYlGn')  # Red-Yellow-Green colormap
-        norm = Normalize(0, 100)  # fix: use Normalize from matplotlib.colors
-        colors = [cmap(norm(p)) for p in percentages]
+        colors = _CHART_CMAP(_CHART_NORM(np.asarray(percentages)))
 
-        bars = ax.barh(maps, percentages, color=colors, edgecolor='white', alpha=0.8)
+        bars = ax.barh(names, percentages, color=colors, edgecolor='white', alpha=0.8)
 
-        # Add value labels - ALWAYS BLACK
-        for bar in bars:
-            width = bar.get_width()
-            ax.text(width + 1, bar.get_y() + bar.get_height() / 2,
-                    f'{width:.1f}%',
-                    va='center',
-                    color='black',
-                    bbox=dict(facecolor='none', edgecolor='none', alpha=0))
+        # Add value labels in one batched call (always black)
+        label_kwargs = {'bbox': label_bbox} if label_bbox else {}
+        ax.bar_label(bars, labels=bar_labels, padding=3, color='black', **label_kwargs)
 
         # Customize chart
         ax.set_xlim(0, 110)
         ax.set_xlabel('Win Percentage')
-        ax.set_title('Win Percentage by Map')
+        ax.set_title(title)
 
         # Add key threshold lines
         thresholds = [33.3, 50, 66.6]
         threshold_colors = ['#ff4757', '#ffa502', '#2ed573']
 
         # Position threshold labels above the bars
-        label_y_position = len(maps) + 0.2
+        label_y_position = len(names) + label_y_offset
 
         for threshold, color in zip(thresholds, threshold_colors):
             ax.axvline(x=threshold, color=color, linestyle='--', alpha=0.7, linewidth=1.5)
@@ -1192,9 +1374,7 @@ class OverwatchStatsApp:
                     bbox=dict(facecolor='none', edgecolor='none', alpha=0))
 
         # Add colorbar legend
-        sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
-        sm.set_array([])
-        cbar = plt.colorbar(sm, ax=ax, orientation='vertical', pad=0.02, shrink=0.5)
+        cbar = fig.colorbar(_CHART_SM, ax=ax, orientation='vertical', pad=0.02, shrink=0.5)
         cbar.set_label('Performance Level', rotation=270, labelpad=15)
         cbar.ax.axhline(0.333, color='#ff4757', linestyle='--', linewidth=1.5)
         cbar.ax.axhline(0.5, color='#ffa502', linestyle='--', linewidth=1.5)
@@ -1203,367 +1383,115 @@ class OverwatchStatsApp:
         # Custom grid and appearance
         ax.grid(axis='x', linestyle='--', alpha=0.3)
         ax.set_axisbelow(True)
-        plt.tight_layout()
+        fig.tight_layout()
 
         return fig
 
-    def create_hero_win_percentage_chart(self):
-        """Create a bar chart for hero win percentages with gradient coloring"""
-        # Extract data from the results text
-        lines = self.results_text.get(1.0, tk.END).split('\n')
-        data = []
+    def create_win_percentage_chart(self):
+        """Create a bar chart for win percentages with gradient coloring and clear labels"""
+        data = self._parse_map_percent_rows()
+        if not data:
+            messagebox.showwarning("Chart Warning", "No valid win percentage data found in results.")
+            return None
 
-        for line in lines:
-            if '|' in line and not line.startswith('-') and not line.startswith('Hero'):
-                parts = [p.strip() for p in line.split('|')]
-                if len(parts) >= 5:
-                    try:
-                        hero = parts[0]
-                        weighted_wins = float(parts[2])
-                        weighted_losses = float(parts[3])
-                        win_percent_str = parts[4].replace('%', '').strip()
-
-                        if win_percent_str.replace('.', '').isdigit():
-                            win_percent = float(win_percent_str)
-                            total_weighted = weighted_wins + weighted_losses
-                            if total_weighted > 0:
-                                data.append((hero, win_percent, weighted_wins, weighted_losses))
-                    except (ValueError, IndexError):
-                        continue
+        data.sort(key=lambda x: x[1])
+        maps = [d[0] for d in data]
+        percentages = [d[1] for d in data]
+
+        return self._render_gradient_barh(
+            maps, percentages,
+            [f'{p:.1f}%' for p in percentages],
+            'Win Percentage by Map')
 
+    def create_hero_win_percentage_chart(self):
+        """Create a bar chart for hero win percentages with gradient coloring"""
+        data = self._parse_weighted_hero_rows()
         if not data:
             messagebox.showwarning("Chart Warning", "No valid hero win percentage data found in results.")
             return None
 
-        # Prepare data for chart
         data.sort(key=lambda x: x[1])
         heroes = [d[0] for d in data]
         percentages = [d[1] for d in data]
-        weighted_wins = [d[2] for d in data]
-        weighted_losses = [d[3] for d in data]
+        labels = [f'{p:.1f}% ({w:.1f}W/{l:.1f}L)'
+                  for _, p, w, l in data]
 
-        # Create figure with slightly larger width to accommodate labels
-        fig, ax = plt.subplots(figsize=(10, 8))
+        return self._render_gradient_barh(
+            heroes, percentages, labels,
+            'Hero Win Percentages (Weighted by Playtime)',
+            height=8, label_y_offset=-0.5, label_bbox=self._CHART_LABEL_BBOX)
 
-        # Create color gradient from red to green
-        cmap = plt.get_cmap('RdYlGn')
-        norm = Normalize(0, 100)
-        colors = [cmap(norm(p)) for p in percentages]
-
-        bars = ax.barh(heroes, percentages, color=colors, edgecolor='white', alpha=0.8)
-
-        # Add value labels (always black)
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            ax.text(width + 1, bar.get_y() + bar.get_height() / 2,
-                    f'{width:.1f}% ({weighted_wins[i]:.1f}W/{weighted_losses[i]:.1f}L)',
-                    va='center',
-                    color='black',
-                    bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2'))
-
-        # Customize chart
-        ax.set_xlim(0, 110)
-        ax.set_xlabel('Win Percentage')
-        ax.set_title('Hero Win Percentages (Weighted by Playtime)')
+    def _parse_game_mode_rows(self):
+        """Extract (mode, win%, match count) rows"""
+        cached = self._parsed_rows.get('game_mode')
+        if cached is not None:
+            return cached
 
-        # Add key threshold lines
-        thresholds = [33.3, 50, 66.6]
-        threshold_colors = ['#ff4757', '#ffa502', '#2ed573']
-
-        # Position threshold labels above the bars
-        label_y_position = len(heroes) - 0.5
-
-        for threshold, color in zip(thresholds, threshold_colors):
-            ax.axvline(x=threshold, color=color, linestyle='--', alpha=0.7, linewidth=1.5)
-            ax.text(threshold + 1, label_y_position,
-                    f'{threshold}%',
-                    color=color,
-                    va='center',
-                    fontsize=9,
-                    bbox=dict(facecolor='none', edgecolor='none', alpha=0))
-
-        # Add colorbar legend
-        sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
-        sm.set_array([])
-        cbar = plt.colorbar(sm, ax=ax, orientation='vertical', pad=0.02, shrink=0.5)
-        cbar.set_label('Performance Level', rotation=270, labelpad=15)
-        cbar.ax.axhline(0.333, color='#ff4757', linestyle='--', linewidth=1.5)
-        cbar.ax.axhline(0.5, color='#ffa502', linestyle='--', linewidth=1.5)
-        cbar.ax.axhline(0.666, color='#2ed573', linestyle='--', linewidth=1.5)
-
-        # Custom grid and appearance
-        ax.grid(axis='x', linestyle='--', alpha=0.3)
-        ax.set_axisbelow(True)
-        plt.tight_layout()
-
-        return fig
+        data = []
+        for parts in _parse_table(self._results_chart_text(), 6):
+            try:
+                wins = int(parts[2])
+                losses = int(parts[3])
+            except ValueError:
+                continue
+            win_percent = _parse_percent(parts[4])
+            if win_percent is not None and (wins + losses) > 0:
+                data.append((parts[0], win_percent, wins + losses))
+        self._parsed_rows['game_mode'] = data
+        return data
 
     def create_game_mode_chart(self):
         """Create a bar chart for game mode win percentages with gradient coloring"""
-        # Extract data from the results text
-        lines = self.results_text.get(1.0, tk.END).split('\n')
-        data = []
-
-        for line in lines:
-            if '|' in line and not line.startswith('-') and not line.startswith('Game Mode'):
-                parts = [p.strip() for p in line.split('|')]
-                if len(parts) >= 6:
-                    try:
-                        mode = parts[0]
-                        wins = int(parts[2])
-                        losses = int(parts[3])
-                        win_percent_str = parts[4].replace('%', '').strip()
-
-                        if win_percent_str.replace('.', '').isdigit():
-                            win_percent = float(win_percent_str)
-                            total_matches = wins + losses
-                            if total_matches > 0:
-                                data.append((mode, win_percent, total_matches))
-                    except (ValueError, IndexError):
-                        continue
+        data = self._parse_game_mode_rows()
 
         if not data:
             messagebox.showwarning("Chart Warning", "No valid game mode data found in results.")
             return None
 
-        # Prepare data for chart
         data.sort(key=lambda x: x[1])
         modes = [d[0] for d in data]
         percentages = [d[1] for d in data]
-        match_counts = [d[2] for d in data]
-
-        # Create figure with slightly larger width to accommodate labels
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        # Create color gradient from red to green
-        cmap = plt.get_cmap('RdYlGn')
-        norm = Normalize(0, 100)
-        colors = [cmap(norm(p)) for p in percentages]
-
-        bars = ax.barh(modes, percentages, color=colors, edgecolor='white', alpha=0.8)
-
-        # Add value labels and match counts (always black)
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            ax.text(width + 1, bar.get_y() + bar.get_height() / 2,
-                    f'{width:.1f}% ({match_counts[i]} matches)',
-                    va='center',
-                    color='black',
-                    bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2'))
-
-        # Customize chart
-        ax.set_xlim(0, 110)
-        ax.set_xlabel('Win Percentage')
-        ax.set_title('Win Percentage by Game Mode')
-
-        # Add key threshold lines
-        thresholds = [33.3, 50, 66.6]
-        threshold_colors = ['#ff4757', '#ffa502', '#2ed573']
-
-        # Position threshold labels above the bars
-        label_y_position = len(modes) - 0.5
+        labels = [f'{p:.1f}% ({count} matches)'
+                  for _, p, count in data]
 
-        for threshold, color in zip(thresholds, threshold_colors):
-            ax.axvline(x=threshold, color=color, linestyle='--', alpha=0.7, linewidth=1.5)
-            ax.text(threshold + 1, label_y_position,
-                    f'{threshold}%',
-                    color=color,
-                    va='center',
-                    fontsize=9,
-                    bbox=dict(facecolor='none', edgecolor='none', alpha=0))
-
-        # Add colorbar legend
-        sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
-        sm.set_array([])
-        cbar = plt.colorbar(sm, ax=ax, orientation='vertical', pad=0.02, shrink=0.5)
-        cbar.set_label('Performance Level', rotation=270, labelpad=15)
-        cbar.ax.axhline(0.333, color='#ff4757', linestyle='--', linewidth=1.5)
-        cbar.ax.axhline(0.5, color='#ffa502', linestyle='--', linewidth=1.5)
-        cbar.ax.axhline(0.666, color='#2ed573', linestyle='--', linewidth=1.5)
-
-        # Custom grid and appearance
-        ax.grid(axis='x', linestyle='--', alpha=0.3)
-        ax.set_axisbelow(True)
-        plt.tight_layout()
-
-        return fig
+        return self._render_gradient_barh(
+            modes, percentages, labels,
+            'Win Percentage by Game Mode',
+            label_y_offset=-0.5, label_bbox=self._CHART_LABEL_BBOX)
 
     def create_hero_map_chart(self):
         """Create a bar chart for a hero's win percentages across maps"""
-        # Extract data from the results text
-        lines = self.results_text.get(1.0, tk.END).split('\n')
-        data = []
-        hero_name = self.selection_var.get()
-
-        for line in lines:
-            if '|' in line and not line.startswith('-') and not line.startswith('Map'):
-                parts = [p.strip() for p in line.split('|')]
-                if len(parts) >= 6:
-                    try:
-                        map_name = parts[0]
-                        win_percent_str = parts[-1].replace('%', '').strip()
-                        if win_percent_str.replace('.', '').isdigit():
-                            win_percent = float(win_percent_str)
-                            data.append((map_name, win_percent))
-                    except (ValueError, IndexError):
-                        continue
-
+        data = self._parse_map_percent_rows()
         if not data:
             messagebox.showwarning("Chart Warning", "No valid win percentage data found in results.")
             return None
 
-        # Prepare data for chart
         data.sort(key=lambda x: x[1])
         maps = [d[0] for d in data]
         percentages = [d[1] for d in data]
 
-        # Create figure with slightly larger width to accommodate labels
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        # Create color gradient from red to green
-        cmap = plt.get_cmap('RdYlGn')
-        norm = Normalize(0, 100)  # fix: use Normalize from matplotlib.colors
-        colors = [cmap(norm(p)) for p in percentages]
-
-        bars = ax.barh(maps, percentages, color=colors, edgecolor='white', alpha=0.8)
-
-        # Add value labels - ALWAYS BLACK
-        for bar in bars:
-            width = bar.get_width()
-            ax.text(width + 1, bar.get_y() + bar.get_height() / 2,
-                    f'{width:.1f}%',
-                    va='center',
-                    color='black',
-                    bbox=dict(facecolor='none', edgecolor='none', alpha=0))
-
-        # Customize chart
-        ax.set_xlim(0, 110)
-        ax.set_xlabel('Win Percentage')
-        ax.set_title(f'Win Percentage by Map for {hero_name}')
-
-        # Add key threshold lines
-        thresholds = [33.3, 50, 66.6]
-        threshold_colors = ['#ff4757', '#ffa502', '#2ed573']
-
-        # Position threshold labels above the bars
-        label_y_position = len(maps) + 0.2
-
-        for threshold, color in zip(thresholds, threshold_colors):
-            ax.axvline(x=threshold, color=color, linestyle='--', alpha=0.7, linewidth=1.5)
-            ax.text(threshold + 1, label_y_position,
-                    f'{threshold}%',
-                    color=color,
-                    va='center',
-                    fontsize=9,
-                    bbox=dict(facecolor='none', edgecolor='none', alpha=0))
-
-        # Add colorbar legend
-        sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
-        sm.set_array([])
-        cbar = plt.colorbar(sm, ax=ax, orientation='vertical', pad=0.02, shrink=0.5)
-        cbar.set_label('Performance Level', rotation=270, labelpad=15)
-        cbar.ax.axhline(0.333, color='#ff4757', linestyle='--', linewidth=1.5)
-        cbar.ax.axhline(0.5, color='#ffa502', linestyle='--', linewidth=1.5)
-        cbar.ax.axhline(0.666, color='#2ed573', linestyle='--', linewidth=1.5)
-
-        # Custom grid and appearance
-        ax.grid(axis='x', linestyle='--', alpha=0.3)
-        ax.set_axisbelow(True)
-        plt.tight_layout()
-
-        return fig
+        return self._render_gradient_barh(
+            maps, percentages,
+            [f'{p:.1f}%' for p in percentages],
+            f'Win Percentage by Map for {self.selection_var.get()}')
 
     def create_map_hero_chart(self):
         """Create a bar chart for hero win percentages on a specific map"""
-        # Extract data from the results text
-        lines = self.results_text.get(1.0, tk.END).split('\n')
-        data = []
-        map_name = self.selection_var.get()
-
-        for line in lines:
-            if '|' in line and not line.startswith('-') and not line.startswith('Hero'):
-                parts = [p.strip() for p in line.split('|')]
-                if len(parts) >= 5:
-                    try:
-                        hero = parts[0]
-                        weighted_wins = float(parts[2])
-                        weighted_losses = float(parts[3])
-                        win_percent_str = parts[4].replace('%', '').strip()
-
-                        if win_percent_str.replace('.', '').isdigit():
-                            win_percent = float(win_percent_str)
-                            total_weighted = weighted_wins + weighted_losses
-                            if total_weighted > 0:
-                                data.append((hero, win_percent, weighted_wins, weighted_losses))
-                    except (ValueError, IndexError):
-                        continue
-
+        data = self._parse_weighted_hero_rows()
         if not data:
             messagebox.showwarning("Chart Warning", "No valid hero win percentage data found in results.")
             return None
 
-        # Prepare data for chart
         data.sort(key=lambda x: x[1])
         heroes = [d[0] for d in data]
         percentages = [d[1] for d in data]
-        weighted_wins = [d[2] for d in data]
-        weighted_losses = [d[3] for d in data]
-
-        # Create figure with slightly larger width to accommodate labels
-        fig, ax = plt.subplots(figsize=(10, 8))
-
-        # Create color gradient from red to green
-        cmap = plt.get_cmap('RdYlGn')
-        norm = Normalize(0, 100)
-        colors = [cmap(norm(p)) for p in percentages]
-
-        bars = ax.barh(heroes, percentages, color=colors, edgecolor='white', alpha=0.8)
-
-        # Add value labels (always black)
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            ax.text(width + 1, bar.get_y() + bar.get_height() / 2,
-                    f'{width:.1f}% ({weighted_wins[i]:.1f}W/{weighted_losses[i]:.1f}L)',
-                    va='center',
-                    color='black',
-                    bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2'))
-
-        # Customize chart
-        ax.set_xlim(0, 110)
-        ax.set_xlabel('Win Percentage')
-        ax.set_title(f'Hero Win Percentages on {map_name}')
-
-        # Add key threshold lines
-        thresholds = [33.3, 50, 66.6]
-        threshold_colors = ['#ff4757', '#ffa502', '#2ed573']
-
-        # Position threshold labels above the bars
-        label_y_position = len(heroes) - 0.5
+        labels = [f'{p:.1f}% ({w:.1f}W/{l:.1f}L)'
+                  for _, p, w, l in data]
 
-        for threshold, color in zip(thresholds, threshold_colors):
-            ax.axvline(x=threshold, color=color, linestyle='--', alpha=0.7, linewidth=1.5)
-            ax.text(threshold + 1, label_y_position,
-                    f'{threshold}%',
-                    color=color,
-                    va='center',
-                    fontsize=9,
-                    bbox=dict(facecolor='none', edgecolor='none', alpha=0))
-
-        # Add colorbar legend
-        sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
-        sm.set_array([])
-        cbar = plt.colorbar(sm, ax=ax, orientation='vertical', pad=0.02, shrink=0.5)
-        cbar.set_label('Performance Level', rotation=270, labelpad=15)
-        cbar.ax.axhline(0.333, color='#ff4757', linestyle='--', linewidth=1.5)
-        cbar.ax.axhline(0.5, color='#ffa502', linestyle='--', linewidth=1.5)
-        cbar.ax.axhline(0.666, color='#2ed573', linestyle='--', linewidth=1.5)
-
-        # Custom grid and appearance
-        ax.grid(axis='x', linestyle='--', alpha=0.3)
-        ax.set_axisbelow(True)
-        plt.tight_layout()
-
-        return fig
+        return self._render_gradient_barh(
+            heroes, percentages, labels,
+            f'Hero Win Percentages on {self.selection_var.get()}',
+            height=8, label_y_offset=-0.5, label_bbox=self._CHART_LABEL_BBOX)
 
     def show_about(self):
         """Display the about dialog"""
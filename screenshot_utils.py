@@ -1,13 +1,38 @@
 # screenshot_utils.py
 
-from PIL import Image, ImageEnhance
+from PIL import Image
+import numpy as np
 import pytesseract
+import functools
+import hashlib
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime
 import logging
 from difflib import get_close_matches
 from pathlib import Path
 from heros import OVERWATCH_HEROES, HERO_CORRECTIONS
+from map_categories import OVERWATCH_MAPS
+
+# Optional in-process Tesseract bindings. tesserocr keeps one engine (and its
+# loaded language model) alive for the app's lifetime instead of paying a
+# subprocess spawn plus temp-file round trip per pytesseract call; users
+# without it silently fall back to pytesseract.
+try:
+    from tesserocr import PyTessBaseAPI
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# rapidfuzz scores in C++ with a fail-fast cutoff, far faster than difflib's
+# pure-Python SequenceMatcher; difflib remains the fallback when it is not
+# installed.
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 # --- Constants ---
 PERCENTAGE_MIN = 98
@@ -19,6 +44,12 @@ REFERENCE_HEIGHT = 1080
 REFERENCE_MAP_REGION = (1296, 177, 1624, 210)
 REFERENCE_GAME_LENGTH_REGION = (1328, 745, 1508, 765)
 
+# Flattened hero lookups built once at import; clean_hero_name previously
+# re-flattened the role dict with sum(..., []) twice per call
+ALL_HEROES = [hero for role in OVERWATCH_HEROES.values() for hero in role]
+_ALL_HEROES_UPPER = [hero.upper() for hero in ALL_HEROES]
+_UPPER_TO_HERO = dict(zip(_ALL_HEROES_UPPER, ALL_HEROES))
+
 # Generate a whitelist string of all hero names in uppercase for OCR
 hero_names_upper = '|'.join(
     [hero.upper() for role in OVERWATCH_HEROES.values() for hero in role] +
@@ -37,6 +68,13 @@ HERO_CONFIG = f'''
 -c user_words="{hero_names_upper}"
 '''
 
+# Per-region Tesseract configs. Each region has a known shape and character
+# set, so the page-segmentation mode and whitelist are pinned instead of
+# letting Tesseract auto-detect layout; the PSM values stay as tuned for
+# these regions (6 for the percentage block, 7 for the single-line strip).
+PERCENTAGE_CONFIG = '--psm 6 --oem 3 -c tessedit_char_whitelist=0123456789%'
+GAME_LENGTH_CONFIG = '--psm 7 -c tessedit_char_whitelist=0123456789:'
+
 # Hero regions
 HERO_REGIONS = {
     '1_Hero': (266, 261, 462, 302),
@@ -82,76 +120,210 @@ TERTIARY_HERO_SETTINGS = {
     'HERO_RESIZE': 1
 }
 
-def preprocess_hero_region(image_region, threshold, contrast, resize):
-    """Special preprocessing for hero name regions with customizable settings"""
-    img = image_region.convert('L')
-    enhancer = ImageEnhance.Contrast(img)
-    img = enhancer.enhance(contrast)
-    img = img.point(lambda x: 0 if x < threshold else 255)
+# 256-entry lookup table for the fixed white-text threshold used on the map
+# and game-length strips; passing it to Image.point avoids rebuilding the
+# table from a Python lambda on every screenshot
+_THRESHOLD_200_LUT = bytes(0 if value < 200 else 255 for value in range(256))
+
+# Extraction patterns, compiled once at import instead of per call.
+# _HERO_CLEAN_RE scrubs OCR'd hero names; a character class covers the full
+# Unicode range, which a bounded translate table cannot (the pytesseract
+# fallback and .upper() can both produce code points above Latin-1).
+_HERO_CLEAN_RE = re.compile(r'[^A-Z\s:.\-ÉÜÖÄÑ]')
+_PERCENTAGE_RE = re.compile(r'(\d{1,3})%?')
+_GAME_LENGTH_RE = re.compile(r"GAME LENGTH:\s*(\d+:\d+)")
+_MMSS_RE = re.compile(r"(\d{1,2}):(\d{2})")
+_RESULT_RE = re.compile(r"(VICTORY|DEFEAT|DRAW)", re.IGNORECASE)
+_FINAL_SCORE_RE = re.compile(r"FINAL SCORE:\s*(\d+)\s*VS\s*(\d+)", re.IGNORECASE)
+_DATE_RE = re.compile(r"DATE:\s*(\d{2}/\d{2}/\d{2})\s*-\s*(\d{2}:\d{2})")
+
+# Pulled out of the pytesseract-style config strings when routing a call
+# through the tesserocr API
+_CONFIG_PSM_RE = re.compile(r'--psm\s+(\d+)')
+_CONFIG_VAR_RE = re.compile(r'-c\s+([A-Za-z_]+)=(?:"([^"]*)"|(\S+))')
+
+# One persistent API per distinct config string: Tesseract variables are
+# sticky on an instance, so sharing one API across configs would leak
+# whitelists/penalties between regions. Only a handful of configs exist.
+# The API objects are not thread-safe and region OCR runs on worker
+# threads, so each entry carries its own lock serializing use of that
+# engine; the guard lock protects lazy construction itself.
+_tess_apis = {}
+_tess_apis_guard = threading.Lock()
+
+# OCR results keyed by a hash of the region pixels + config. Hero icons and
+# repeated screenshots produce identical regions, and hashing a small crop is
+# orders of magnitude cheaper than re-running Tesseract on it. Bounded like
+# the lru_cache helpers elsewhere in this module so a long-running GUI
+# session can't grow it without limit; the lock keeps eviction sane when
+# region OCR runs on worker threads.
+_OCR_CACHE_MAX = 4096
+_ocr_cache = OrderedDict()
+_ocr_cache_lock = threading.Lock()
+
+
+def _get_tess_api(config=''):
+    """Lazily create (and cache) a tesserocr API and its lock for config"""
+    with _tess_apis_guard:
+        entry = _tess_apis.get(config)
+        if entry is None:
+            api = PyTessBaseAPI(lang='eng')
+            psm_match = _CONFIG_PSM_RE.search(config)
+            if psm_match:
+                api.SetPageSegMode(int(psm_match.group(1)))
+            for name, quoted, bare in _CONFIG_VAR_RE.findall(config):
+                api.SetVariable(name, quoted or bare)
+            entry = (api, threading.Lock())
+            _tess_apis[config] = entry
+    return entry
+
+
+def _image_to_string(image, config=''):
+    """OCR a PIL image to text.
+
+    Uses the persistent tesserocr engine when available (reconfiguring page
+    segmentation mode and character whitelist from the pytesseract-style
+    config string), otherwise falls back to a pytesseract subprocess call.
+    Results are memoized by a digest of the pixel data and config.
+    """
+    cache_key = (hashlib.blake2b(image.tobytes(), digest_size=16).digest(),
+                 image.size, image.mode, config)
+    with _ocr_cache_lock:
+        cached = _ocr_cache.get(cache_key)
+        if cached is not None:
+            _ocr_cache.move_to_end(cache_key)
+            return cached
+
+    text = _run_ocr(image, config)
+    with _ocr_cache_lock:
+        _ocr_cache[cache_key] = text
+        if len(_ocr_cache) > _OCR_CACHE_MAX:
+            _ocr_cache.popitem(last=False)
+    return text
+
+
+def _run_ocr(image, config):
+    """Run Tesseract on a PIL image via tesserocr or the pytesseract fallback"""
+    if TESSEROCR_AVAILABLE:
+        api, lock = _get_tess_api(config)
+        # SetImage/GetUTF8Text must not interleave across threads on one
+        # engine, or results cross-wire between screenshots
+        with lock:
+            api.SetImage(image)
+            return api.GetUTF8Text()
+    return pytesseract.image_to_string(image, config=config)
+
+
+def _binarize_region(image_region, threshold, contrast):
+    """Contrast-stretch and threshold a region in one NumPy pass.
+
+    Matches ImageEnhance.Contrast (interpolation against the rounded mean of
+    the grayscale image) followed by the 0/255 threshold, without allocating
+    the intermediate PIL images the Enhance/point chain produced. PIL's
+    blend truncates on the float-to-uint8 cast, so clip + astype (not
+    rounding) keeps the output bit-identical to the old chain.
+    """
+    if isinstance(image_region, np.ndarray):
+        arr = image_region.astype(np.float32)
+    else:
+        if image_region.mode != 'L':
+            image_region = image_region.convert('L')
+        arr = np.asarray(image_region, dtype=np.float32)
+    mean = np.float32(int(arr.mean() + 0.5))
+    stretched = np.clip(mean + contrast * (arr - mean), 0, 255).astype(np.uint8)
+    binary = np.where(stretched < threshold, np.uint8(0), np.uint8(255))
+    return Image.fromarray(binary, 'L')
+
+def _preprocess_region(image_region, threshold, contrast, resize):
+    """Shared binarize-and-upscale pipeline for hero and percentage regions"""
+    img = _binarize_region(image_region, threshold, contrast)
 
     if resize > 1:
-        img = img.resize((img.width * resize, img.height * resize), Image.Resampling.LANCZOS)
+        # The mask is already pure 0/255; NEAREST avoids LANCZOS' 8-tap
+        # filtering and the gray halo it reintroduces around glyph edges
+        img = img.resize((img.width * resize, img.height * resize), Image.Resampling.NEAREST)
 
     return img
 
+def preprocess_hero_region(image_region, threshold, contrast, resize):
+    """Special preprocessing for hero name regions with customizable settings"""
+    return _preprocess_region(image_region, threshold, contrast, resize)
+
 def preprocess_percentage_region(image_region, settings):
     """Preprocessing for percentage regions with customizable settings"""
-    img = image_region.convert('L')
-    enhancer = ImageEnhance.Contrast(img)
-    img = enhancer.enhance(settings['CONTRAST'])
-    img = img.point(lambda x: 0 if x < settings['THRESHOLD'] else 255)
-
-    if settings['RESIZE'] > 1:
-        img = img.resize((img.width * settings['RESIZE'], img.height * settings['RESIZE']), Image.Resampling.LANCZOS)
+    return _preprocess_region(image_region, settings['THRESHOLD'],
+                              settings['CONTRAST'], settings['RESIZE'])
 
-    return img
+@functools.lru_cache(maxsize=4096)
+def clean_hero_name(text: str) -> str | None:
+    """Clean and standardize hero names with priority to corrections.
 
-def clean_hero_name(text: str, hero_corrections: dict, overwatch_heroes: dict) -> str | None:
-    """Clean and standardize hero names with priority to corrections"""
+    Hero lookups go through the precomputed module-level tables; the roster
+    and corrections are static, so results are memoized on the raw OCR text
+    (identical misreads recur constantly across a batch). Roster changes
+    would require clean_hero_name.cache_clear().
+    """
     if not text.strip():
         return None  # Return None for empty text
 
-    upper_text = text.strip().upper()
-    upper_text = re.sub(r'[^A-Z\s:.\-ÉÜÖÄÑ]', '', upper_text)
+    upper_text = _HERO_CLEAN_RE.sub('', text.strip().upper())
 
     # 1. Check corrections first - exact match
-    if upper_text in hero_corrections:
-        return hero_corrections[upper_text]
+    if upper_text in HERO_CORRECTIONS:
+        return HERO_CORRECTIONS[upper_text]
 
     # 2. Check against known hero names - exact match
-    for role, heroes in overwatch_heroes.items():
-        for hero in heroes:
-            if upper_text == hero.upper():
-                return hero  # Return the properly capitalized version
-
-    # 3. If still not found, try close matches with higher threshold
-    matches = get_close_matches(upper_text,
-                              [h.upper() for h in sum(overwatch_heroes.values(), [])],
-                              n=1, cutoff=0.8)
-    if matches:
-        for hero in sum(overwatch_heroes.values(), []):
-            if hero.upper() == matches[0]:
-                return hero
+    hero = _UPPER_TO_HERO.get(upper_text)
+    if hero:
+        return hero  # The properly capitalized version
+
+    # 3. If still not found, try close matches with higher threshold.
+    # Candidates whose length differs too much can never reach the 0.8
+    # ratio, so prune them before paying for a SequenceMatcher each.
+    text_len = len(upper_text)
+    max_len_diff = max(2, text_len // 5)
+    candidates = [name for name in _ALL_HEROES_UPPER
+                  if abs(len(name) - text_len) <= max_len_diff]
+    if RAPIDFUZZ_AVAILABLE:
+        best = fuzz_process.extractOne(upper_text, candidates,
+                                       scorer=fuzz.ratio, score_cutoff=80)
+        if best:
+            return _UPPER_TO_HERO[best[0]]
+    else:
+        matches = get_close_matches(upper_text, candidates, n=1, cutoff=0.8)
+        if matches:
+            return _UPPER_TO_HERO[matches[0]]
 
     logging.debug(f"No match found for hero name: {upper_text}")
     return None  # Return None if no match found
 
+# Known OCR misreads of '100', applied through one alternation pattern; the
+# search() gate means clean text (the common case) costs a single scan
+# instead of nine sequential str.replace passes
+_PERCENT_CORRECTIONS = {
+    '7j00': '100', 'zj00': '100', ']00': '100',
+    '70o': '100', '7o0': '100', 'T00': '100',
+    'lj00': '100', 'i00': '100', '?00': '100'
+}
+_PERCENT_CORRECT_RE = re.compile('|'.join(re.escape(k) for k in _PERCENT_CORRECTIONS))
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_percentage(text):
     """Percentage extraction with OCR error corrections without capping at 100"""
-    corrections = {
-        '7j00': '100', 'zj00': '100', ']00': '100',
-        '70o': '100', '7o0': '100', 'T00': '100',
-        'lj00': '100', 'i00': '100', '?00': '100'
-    }
-
-    for wrong, right in corrections.items():
-        text = text.replace(wrong, right)
+    if _PERCENT_CORRECT_RE.search(text):
+        text = _PERCENT_CORRECT_RE.sub(lambda m: _PERCENT_CORRECTIONS[m.group(0)], text)
 
-    match = re.search(r'(\d{1,3})%?', text)
+    match = _PERCENTAGE_RE.search(text)
     return int(match.group(1)) if match else 0
 
+@functools.lru_cache(maxsize=256)
 def calculate_scaled_region(image_width, image_height, original_region):
-    """Calculate the scaled region based on the current image resolution"""
+    """Calculate the scaled region based on the current image resolution.
+
+    Cached: a batch of screenshots is typically all one resolution, so each
+    (size, region) pair is computed once and then served from the cache.
+    """
     width_scale = image_width / REFERENCE_WIDTH
     height_scale = image_height / REFERENCE_HEIGHT
 
@@ -170,7 +342,7 @@ def extract_game_length(image, text):
     """
     # Attempt 1: Find "GAME LENGTH: M:SS" in the full text
     raw_match_1 = None
-    length_match = re.search(r"GAME LENGTH:\s*(\d+:\d+)", text)
+    length_match = _GAME_LENGTH_RE.search(text)
     if length_match:
         raw_match_1 = length_match.group(1)
         try:
@@ -185,13 +357,14 @@ def extract_game_length(image, text):
         width, height = image.size
         game_length_region = calculate_scaled_region(width, height, REFERENCE_GAME_LENGTH_REGION)
 
-        length_img = image.crop(game_length_region).convert('L')
-        length_img = length_img.point(lambda x: 0 if x < 200 else 255)  # Simple threshold for white text
+        length_img = image.crop(game_length_region)
+        if length_img.mode != 'L':
+            length_img = length_img.convert('L')
+        length_img = length_img.point(_THRESHOLD_200_LUT)  # Simple threshold for white text
 
-        tesseract_config = '--psm 7 -c tessedit_char_whitelist=0123456789:'
-        raw_length_text_2 = pytesseract.image_to_string(length_img, config=tesseract_config).strip()
+        raw_length_text_2 = _image_to_string(length_img, GAME_LENGTH_CONFIG).strip()
 
-        length_match_region = re.search(r"(\d{1,2}):(\d{2})", raw_length_text_2)
+        length_match_region = _MMSS_RE.search(raw_length_text_2)
         if length_match_region:
             mins, secs = map(int, length_match_region.groups())
             return (mins * 60 + secs, raw_match_1, raw_length_text_2)
@@ -201,11 +374,11 @@ def extract_game_length(image, text):
 
 def determine_result(text):
     """Determine match result from OCR text"""
-    result_match = re.search(r"(VICTORY|DEFEAT|DRAW)", text, re.IGNORECASE)
+    result_match = _RESULT_RE.search(text)
     if result_match:
         return result_match.group(1).upper()
 
-    score_match = re.search(r"FINAL SCORE:\s*(\d+)\s*VS\s*(\d+)", text, re.IGNORECASE)
+    score_match = _FINAL_SCORE_RE.search(text)
     if score_match:
         your_score = int(score_match.group(1))
         enemy_score = int(score_match.group(2))
@@ -214,7 +387,7 @@ def determine_result(text):
 
 def extract_datetime(text, date_input_format, date_output_format):
     """Extract and format match datetime"""
-    date_match = re.search(r"DATE:\s*(\d{2}/\d{2}/\d{2})\s*-\s*(\d{2}:\d{2})", text)
+    date_match = _DATE_RE.search(text)
     if date_match:
         try:
             naive_dt = datetime.strptime(f"{date_match.group(1)} {date_match.group(2)}",
@@ -259,8 +432,8 @@ def recognize_hero(region, filename=None, region_name=None, debug=False):
             settings['HERO_CONTRAST'],
             settings['HERO_RESIZE']
         )
-        text = pytesseract.image_to_string(processed, config=HERO_CONFIG).strip()
-        hero = clean_hero_name(text, HERO_CORRECTIONS, OVERWATCH_HEROES)
+        text = _image_to_string(processed, HERO_CONFIG).strip()
+        hero = clean_hero_name(text)
         
         if debug:
             print(f"    - Attempt {name}: Raw='{text}', Cleaned='{hero}'")
@@ -268,7 +441,13 @@ def recognize_hero(region, filename=None, region_name=None, debug=False):
         if hero:
             return hero
         results.append((name, text, hero))
-    
+
+        if len(text) < 2:
+            # A (near-)empty read means an unused hero slot rather than a
+            # hard misread; harsher preprocessing won't conjure a name, so
+            # skip the remaining attempts
+            break
+
     if debug and filename and region_name:
         debug_info = ", ".join(f"{n}='{t}'" for n, t, _ in results)
         print(f"Could not recognize hero in {region_name}: {debug_info}")
@@ -277,6 +456,12 @@ def recognize_hero(region, filename=None, region_name=None, debug=False):
 def extract_hero_data(image, filename=None, debug=False):
     """Unified hero data extraction with optional debug output"""
     regions = sorted(HERO_REGIONS.items())
+
+    # Decode/convert the frame once; the six region crops below are then
+    # zero-copy array views instead of per-crop PIL convert allocations
+    gray = image if image.mode == 'L' else image.convert('L')
+    full_gray = np.asarray(gray)
+    image_width, image_height = image.width, image.height
     
     def attempt_extraction(settings_name, settings):
         if debug:
@@ -289,20 +474,17 @@ def extract_hero_data(image, filename=None, debug=False):
             hero_key, hero_coords = regions[i]
             perc_key, perc_coords = regions[i+1]
 
-            hero_region = image.crop(calculate_scaled_region(image.width, image.height, hero_coords))
-            hero_name = recognize_hero(hero_region, filename, hero_key, debug)
+            left, top, right, bottom = calculate_scaled_region(image_width, image_height, hero_coords)
+            hero_name = recognize_hero(full_gray[top:bottom, left:right], filename, hero_key, debug)
 
             if hero_name is None:
                 if debug:
                     print(f"    - Hero: '{hero_key}' -> SKIPPED (No valid hero name recognized)")
                 continue
 
-            perc_region = image.crop(calculate_scaled_region(image.width, image.height, perc_coords))
-            processed_perc = preprocess_percentage_region(perc_region, settings)
-            perc_text = pytesseract.image_to_string(
-                processed_perc, 
-                config='--psm 6 --oem 3 -c tessedit_char_whitelist=0123456789%'
-            ).strip()
+            left, top, right, bottom = calculate_scaled_region(image_width, image_height, perc_coords)
+            processed_perc = preprocess_percentage_region(full_gray[top:bottom, left:right], settings)
+            perc_text = _image_to_string(processed_perc, PERCENTAGE_CONFIG).strip()
             percentage = extract_percentage(perc_text)
             
             if debug:
@@ -362,22 +544,52 @@ def extract_hero_data(image, filename=None, debug=False):
     
     return None
 
-def extract_map_name(image, overwatch_maps, map_corrections, tesseract_config, return_raw=False):
-    """Enhanced map extraction with optional raw text return"""
+# Upper-case -> canonical map lookup for the module roster, built once at
+# import (same pattern as _UPPER_TO_HERO above)
+_UPPER_TO_MAP = {map_name.upper(): map_name for map_name in OVERWATCH_MAPS}
+
+
+def _map_upper_lookup(overwatch_maps):
+    """Return the uppercase exact-match dict for a map list.
+
+    Callers pass the module-level OVERWATCH_MAPS, which hits the precomputed
+    table; any other list gets a throwaway dict rather than a cache entry
+    keyed on a reusable id().
+    """
+    if overwatch_maps is OVERWATCH_MAPS:
+        return _UPPER_TO_MAP
+    return {map_name.upper(): map_name for map_name in overwatch_maps}
+
+
+def extract_map_name(image, overwatch_maps, map_corrections, tesseract_config, return_raw=False,
+                     full_text=None):
+    """Enhanced map extraction with optional raw text return.
+
+    When the caller already has the full-frame OCR text, pass it as
+    full_text: the map name usually appears there on its own line, and an
+    exact line match avoids a second Tesseract call on the map region. The
+    region OCR remains the fallback.
+    """
+    if full_text:
+        lookup = _map_upper_lookup(overwatch_maps)
+        for line in full_text.upper().splitlines():
+            line = line.strip()
+            found_map = lookup.get(line) or map_corrections.get(line)
+            if found_map:
+                return (found_map, line) if return_raw else found_map
+
     try:
         width, height = image.size
         map_region = calculate_scaled_region(width, height, REFERENCE_MAP_REGION)
-        map_img = image.crop(map_region).convert('L')
-        map_img = map_img.point(lambda x: 0 if x < 200 else 255)
-        text = pytesseract.image_to_string(map_img, config=tesseract_config).strip().upper()
+        map_img = image.crop(map_region)
+        if map_img.mode != 'L':
+            map_img = map_img.convert('L')
+        map_img = map_img.point(_THRESHOLD_200_LUT)
+        text = _image_to_string(map_img, tesseract_config).strip().upper()
 
         if return_raw:
             # Always return a tuple when return_raw is True
-            found_map = None
-            for map_name in overwatch_maps:
-                if map_name.upper() == text:
-                    found_map = map_name
-                    break
+            found_map = _map_upper_lookup(overwatch_maps).get(text)
 
             if not found_map and text in map_corrections:
                 found_map = map_corrections[text]
@@ -391,9 +603,9 @@ def extract_map_name(image, overwatch_maps, map_corrections, tesseract_config, r
             return (found_map, text)  # Always return a tuple
 
         # Normal processing when return_raw is False
-        for map_name in overwatch_maps:
-            if map_name.upper() == text:
-                return map_name
+        found_map = _map_upper_lookup(overwatch_maps).get(text)
+        if found_map:
+            return found_map
 
         if text in map_corrections:
             return map_corrections[text]
@@ -1,4 +1,6 @@
 # seasons.py
+import bisect
+import functools
 from datetime import datetime
 
 from config import UTC_TIMEZONE
@@ -20,17 +22,34 @@ SEASON_DATES = {
 }
 
 
+# Season boundaries sorted by start date so lookups can bisect instead of
+# scanning every season's range
+_SEASONS_BY_START = sorted(SEASON_DATES.items(), key=lambda item: item[1]['start'])
+_SEASON_STARTS = [dates['start'] for _, dates in _SEASONS_BY_START]
+
+
+def _season_for_time(match_time):
+    """Season lookup for an aware datetime"""
+    index = bisect.bisect_right(_SEASON_STARTS, match_time) - 1
+    if index < 0:
+        return None
+    season, dates = _SEASONS_BY_START[index]
+    return season if match_time < dates['end'] else None
+
+
+@functools.lru_cache(maxsize=8192)
+def _season_for_string(match_date):
+    """Season lookup for a date string; memoized since bulk imports repeat
+    the same strings and strptime dominates the lookup cost"""
+    match_time = datetime.strptime(match_date, "%Y-%m-%d %H:%M").replace(tzinfo=UTC_TIMEZONE)
+    return _season_for_time(match_time)
+
+
 def get_season_from_date(match_date):
     """
     Determine season from match date string ('YYYY-MM-DD HH:MM' format in UTC)
     Returns season number or None if outside defined seasons
     """
     if isinstance(match_date, str):
-        match_time = datetime.strptime(match_date, "%Y-%m-%d %H:%M").replace(tzinfo=UTC_TIMEZONE)
-    else:
-        match_time = match_date  # Assume datetime object with timezone
-
-    for season, dates in SEASON_DATES.items():
-        if dates['start'] <= match_time < dates['end']:
-            return season
-    return None
\ No newline at end of file
+        return _season_for_string(match_date)
+    return _season_for_time(match_date)  # Assume datetime object with timezone
\ No newline at end of file
@@ -4,15 +4,108 @@ Functions for Overwatch 2 statistics analysis and reporting.
 
 # stats_functions.py
 
+import io
+import itertools
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional
-from map_categories import GAME_MODES
-from seasons import get_season_from_date
+from map_categories import GAME_MODES, MAP_MODES
+from seasons import SEASON_DATES, get_season_from_date
 import config
 import logging
 
 
+def _connect() -> sqlite3.Connection:
+    """Open a connection to the configured database with tuned PRAGMAs.
+
+    The defaults (DELETE journal, synchronous=FULL, small page cache, disk
+    temp store) are worst-case for this read-heavy stats workload; WAL with
+    synchronous=NORMAL also collapses the delete path to one fsync.
+    """
+    database = config.DATABASE_NAME
+    # uri=True lets tests and power users point at 'file:...' URIs, e.g. a
+    # shared in-memory database
+    conn = sqlite3.connect(database, uri=database.startswith('file:'))
+    conn.executescript(
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA cache_size=-20000;"
+        "PRAGMA temp_store=memory;"
+        "PRAGMA busy_timeout=5000;"
+    )
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+# Base report queries as module constants: per-filter variants composed from
+# the same constant are byte-identical strings, so the shared connection's
+# statement cache reuses the prepared statement instead of re-parsing.
+_SQL_MAP_RESULT_COUNTS = (
+    'SELECT map, '
+    "SUM(result = 'VICTORY') AS wins, "
+    "SUM(result = 'DEFEAT') AS losses, "
+    "SUM(result = 'DRAW') AS draws "
+    'FROM matches'
+)
+
+_SQL_HERO_WEIGHTED = '''
+        SELECT mh.hero_name,
+               COUNT(*) AS matches,
+               SUM(CASE WHEN m.result = 'VICTORY' THEN mh.play_percentage ELSE 0 END) / 100.0 AS weighted_wins,
+               SUM(CASE WHEN m.result = 'DEFEAT' THEN mh.play_percentage ELSE 0 END) / 100.0 AS weighted_losses
+        FROM matches m
+        JOIN match_heroes mh ON m.id = mh.match_id
+    '''
+
+_SQL_HERO_MAP_WEIGHTED = '''
+        SELECT m.map,
+               SUM(CASE WHEN m.result = 'VICTORY' THEN mh.play_percentage ELSE 0 END) / 100.0 AS wins,
+               SUM(CASE WHEN m.result = 'DEFEAT' THEN mh.play_percentage ELSE 0 END) / 100.0 AS losses,
+               SUM(CASE WHEN m.result = 'DRAW' THEN mh.play_percentage ELSE 0 END) / 100.0 AS draws
+        FROM matches m
+        JOIN match_heroes mh ON m.id = mh.match_id
+        WHERE mh.hero_name = ?
+    '''
+
+_SQL_MODE_MAP_COUNTS = (
+    'SELECT map, '
+    'COUNT(*) AS matches, '
+    "SUM(result = 'VICTORY') AS wins, "
+    "SUM(result = 'DEFEAT') AS losses, "
+    'SUM(length_sec) AS total_time '
+    'FROM matches'
+)
+
+# Bound .format callables for the hot table rows: one parsed format spec
+# reused per row instead of re-interpreting an f-string's specs each time
+_MAP_ROW_FMT = "{:<25} | {:>7} | {:>6} | {:>7} | {:>7} | {:>5.1f}%\n".format
+_WEIGHTED_MAP_ROW_FMT = "{:<25} | {:>7.1f} | {:>6.1f} | {:>7.1f} | {:>7.1f} | {:>5.1f}%\n".format
+_HERO_ROW_FMT = "{:<20} | {:>8} | {:>14.1f} | {:>16.1f} | {:>5.1f}%\n".format
+_FREQ_ROW_FMT = "{:<25} | {:>7} | {:>5.1f}% | {:>6} | {:>7} | {:>7}\n".format
+_MATCH_ROW_FMT = "{:<12} | {:<8} | {:<22} | {:<8} | {:>9} | {}\n".format
+_MODE_ROW_FMT = "{:<15} | {:>8} | {:>6} | {:>7} | {:>5.1f}% | {:>7.1f}m | {}\n".format
+
+_read_conn: Optional[sqlite3.Connection] = None
+_read_conn_path: Optional[str] = None
+
+
+def _get_read_conn() -> sqlite3.Connection:
+    """Return the shared read connection, reopening on database path changes.
+
+    The report functions are read-only and always run on the caller's
+    thread, so one long-lived connection (with the PRAGMAs and statement
+    cache warm) replaces a connect/teardown per call. Mutations still use
+    their own short-lived connections.
+    """
+    global _read_conn, _read_conn_path
+    if _read_conn is None or _read_conn_path != config.DATABASE_NAME:
+        if _read_conn is not None:
+            _read_conn.close()
+        _read_conn = _connect()
+        _read_conn_path = config.DATABASE_NAME
+    return _read_conn
+
+
 def validate_seasons_param(seasons: Optional[List[int]]):
     """Helper function to validate seasons parameter"""
     if seasons is not None:
@@ -49,35 +142,69 @@ def validate_time_frame(start_date, end_date):
 
 
 def filter_matches_by_time_and_season(rows, start_date: str | None, end_date: str | None, seasons: list[int] | None):
-    """Filter iterable of rows by date and season."""
+    """Filter iterable of rows by date and season.
+
+    Dates are 'YYYY-MM-DD HH:MM' strings, so the day window is a plain
+    string-prefix comparison; nothing is parsed per row and the season
+    lookup only runs when a season filter is actually set.
+    """
+    seasons_set = set(seasons) if seasons else None
+
     filtered = []
     for row in rows:
-        match_time = datetime.strptime(row['date'], config.DATE_OUTPUT_FORMAT)
-        if start_date:
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            if match_time.date() < start_dt.date():
-                continue
-        if end_date:
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-            if match_time.date() > end_dt.date():
-                continue
-        match_season = get_season_from_date(row['date'])
-        if seasons and match_season not in seasons:
+        match_day = row['date'][:10]
+        if start_date and match_day < start_date:
+            continue
+        if end_date and match_day > end_date:
+            continue
+        if seasons_set and get_season_from_date(row['date']) not in seasons_set:
             continue
         filtered.append(row)
     return filtered
 
 
+def build_date_filters(start_date: str | None, end_date: str | None,
+                       seasons: Optional[List[int]], column: str = "date"):
+    """Build a SQL predicate for the date/season filters.
+
+    Match dates are stored as 'YYYY-MM-DD HH:MM' UTC strings, which sort
+    lexicographically, so every comparison stays on the text column and
+    SQLite can use an index instead of Python filtering each row. Returns
+    (predicate, params) where predicate is '' when no filters apply.
+    """
+    clauses = []
+    params = []
+
+    if start_date:
+        clauses.append(f"{column} >= ?")
+        params.append(start_date)
+    if end_date:
+        # end_date is inclusive by day, so compare against the next day
+        next_day = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
+        clauses.append(f"{column} < ?")
+        params.append(next_day.strftime("%Y-%m-%d"))
+    if seasons:
+        ranges = []
+        for season in seasons:
+            dates = SEASON_DATES.get(season)
+            if dates is None:
+                continue
+            ranges.append(f"({column} >= ? AND {column} < ?)")
+            params.append(dates['start'].strftime(config.DATE_OUTPUT_FORMAT))
+            params.append(dates['end'].strftime(config.DATE_OUTPUT_FORMAT))
+        # Unknown seasons match nothing, same as the old per-row lookup
+        clauses.append("(" + " OR ".join(ranges) + ")" if ranges else "0")
+
+    return (" AND ".join(clauses), params) if clauses else ("", [])
+
+
 def delete_match_by_date(match_date: str) -> str:
     """Delete a match by its date"""
     try:
-        with sqlite3.connect(config.DATABASE_NAME) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM matches WHERE date = ?", (match_date,))
-            count = cursor.fetchone()[0]
-            if count == 0:
+        with _connect() as conn:
+            cursor = conn.execute("DELETE FROM matches WHERE date = ?", (match_date,))
+            if cursor.rowcount == 0:
                 return f"No match found with date: {match_date}"
-            cursor.execute("DELETE FROM matches WHERE date = ?", (match_date,))
             conn.commit()
         return f"Successfully deleted match with date: {match_date} (UTC)"
     except Exception as e:
@@ -93,13 +220,15 @@ def print_win_percentages_by_season(seasons: Optional[List[int]] = None, min_mat
     if not validate_time_frame(start_date, end_date):
         raise ValueError("Invalid time frame - start date must be before end date")
 
-    with sqlite3.connect(config.DATABASE_NAME) as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute('SELECT date, map, result FROM matches')
-        rows = cursor.fetchall()
+    predicate, params = build_date_filters(start_date, end_date, seasons)
+    query = _SQL_MAP_RESULT_COUNTS
+    if predicate:
+        query += ' WHERE ' + predicate
+    query += ' GROUP BY map'
 
-    filtered_rows = filter_matches_by_time_and_season(rows, start_date, end_date, seasons)
+    with _get_read_conn() as conn:
+        cursor = conn.execute(query, params)
+        grouped = cursor.fetchall()
 
     title = "Win Percentage by Map"
     if seasons:
@@ -114,24 +243,16 @@ def print_win_percentages_by_season(seasons: Optional[List[int]] = None, min_mat
     output.append(f"{'Map':<25} | {'Played':>7} | {'Wins':>6} | {'Losses':>7} | {'Draws':>7} | {'Win %':>6}\n")
     output.append("-" * 70 + "\n")
 
-    map_stats = {}
-
-    for row in filtered_rows:
-        map_name = row['map']
-        if map_name not in map_stats:
-            map_stats[map_name] = {'wins': 0, 'losses': 0, 'draws': 0}
-
-        if row['result'] == 'VICTORY':
-            map_stats[map_name]['wins'] += 1
-        elif row['result'] == 'DEFEAT':
-            map_stats[map_name]['losses'] += 1
-        elif row['result'] == 'DRAW':
-            map_stats[map_name]['draws'] += 1
+    map_stats = {row['map']: {'wins': row['wins'], 'losses': row['losses'], 'draws': row['draws']}
+                 for row in grouped}
 
     valid_maps = []
+    excluded_count = 0
     for map_name, stats in map_stats.items():
         total_played = stats['wins'] + stats['losses'] + stats['draws']
-        if total_played >= min_matches and (stats['wins'] + stats['losses']) > 0:
+        if total_played < min_matches:
+            excluded_count += 1
+        elif (stats['wins'] + stats['losses']) > 0:
             win_percent = (stats['wins'] / (stats['wins'] + stats['losses'])) * 100
             valid_maps.append((map_name, stats, win_percent))
 
@@ -139,19 +260,11 @@ def print_win_percentages_by_season(seasons: Optional[List[int]] = None, min_mat
 
     for map_name, stats, win_percent in valid_maps:
         total_played = stats['wins'] + stats['losses'] + stats['draws']
-        output.append(
-            f"{map_name:<25} | "
-            f"{total_played:>7} | "
-            f"{stats['wins']:>6} | "
-            f"{stats['losses']:>7} | "
-            f"{stats['draws']:>7} | "
-            f"{win_percent:>5.1f}%\n"
-        )
-
-    excluded = [m for m in map_stats
-                if (map_stats[m]['wins'] + map_stats[m]['losses'] + map_stats[m]['draws']) < min_matches]
-    if excluded:
-        output.append(f"\nNote: Excluded {len(excluded)} maps with fewer than {min_matches} matches\n")
+        output.append(_MAP_ROW_FMT(map_name, total_played, stats['wins'],
+                                   stats['losses'], stats['draws'], win_percent))
+
+    if excluded_count:
+        output.append(f"\nNote: Excluded {excluded_count} maps with fewer than {min_matches} matches\n")
 
     return "".join(output)
 
@@ -165,18 +278,15 @@ def print_hero_win_percentages_by_season(seasons: Optional[List[int]] = None, mi
     if not validate_time_frame(start_date, end_date):
         raise ValueError("Invalid time frame - start date must be before end date")
 
-    with sqlite3.connect(config.DATABASE_NAME) as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT m.id, m.date, m.result, mh.hero_name, mh.play_percentage
-            FROM matches m
-            JOIN match_heroes mh ON m.id = mh.match_id
-            ORDER BY m.date
-        ''')
-        rows = cursor.fetchall()
+    predicate, params = build_date_filters(start_date, end_date, seasons, column='m.date')
+    query = _SQL_HERO_WEIGHTED
+    if predicate:
+        query += ' WHERE ' + predicate
+    query += ' GROUP BY mh.hero_name'
 
-    filtered_rows = filter_matches_by_time_and_season(rows, start_date, end_date, seasons)
+    with _get_read_conn() as conn:
+        cursor = conn.execute(query, params)
+        grouped = cursor.fetchall()
 
     title = "Hero Win Percentages (Weighted by Playtime)"
     if seasons:
@@ -191,31 +301,19 @@ def print_hero_win_percentages_by_season(seasons: Optional[List[int]] = None, mi
     output.append(f"{'Hero':<20} | {'Matches':>8} | {'Weighted Wins':>14} | {'Weighted Losses':>16} | {'Win %':>6}\n")
     output.append("-" * 90 + "\n")
 
-    hero_stats = {}
-
-    for row in filtered_rows:
-        hero = row['hero_name']
-        if hero not in hero_stats:
-            hero_stats[hero] = {
-                'weighted_wins': 0.0,
-                'weighted_losses': 0.0,
-                'matches': 0
-            }
-
-        # Calculate weighted contribution based on play percentage
-        weight = row['play_percentage'] / 100.0
-        hero_stats[hero]['matches'] += 1
-
-        if row['result'] == 'VICTORY':
-            hero_stats[hero]['weighted_wins'] += weight
-        elif row['result'] == 'DEFEAT':
-            hero_stats[hero]['weighted_losses'] += weight
+    hero_stats = {row['hero_name']: {'weighted_wins': row['weighted_wins'],
+                                     'weighted_losses': row['weighted_losses'],
+                                     'matches': row['matches']}
+                  for row in grouped}
 
     # Calculate win percentages and filter by minimum matches
     valid_heroes = []
+    excluded_count = 0
     for hero, stats in hero_stats.items():
         total_weighted = stats['weighted_wins'] + stats['weighted_losses']
-        if stats['matches'] >= min_matches and total_weighted > 0:
+        if stats['matches'] < min_matches:
+            excluded_count += 1
+        elif total_weighted > 0:
             win_percent = (stats['weighted_wins'] / total_weighted) * 100
             valid_heroes.append((hero, stats, win_percent))
 
@@ -223,18 +321,11 @@ def print_hero_win_percentages_by_season(seasons: Optional[List[int]] = None, mi
     valid_heroes.sort(key=lambda x: x[2], reverse=True)
 
     for hero, stats, win_percent in valid_heroes:
-        output.append(
-            f"{hero:<20} | "
-            f"{stats['matches']:>8} | "
-            f"{stats['weighted_wins']:>14.1f} | "
-            f"{stats['weighted_losses']:>16.1f} | "
-            f"{win_percent:>5.1f}%\n"
-        )
-
-    excluded = [h for h in hero_stats
-                if hero_stats[h]['matches'] < min_matches]
-    if excluded:
-        output.append(f"\nNote: Excluded {len(excluded)} heroes with fewer than {min_matches} matches\n")
+        output.append(_HERO_ROW_FMT(hero, stats['matches'], stats['weighted_wins'],
+                                    stats['weighted_losses'], win_percent))
+
+    if excluded_count:
+        output.append(f"\nNote: Excluded {excluded_count} heroes with fewer than {min_matches} matches\n")
 
     return "".join(output)
 
@@ -248,18 +339,15 @@ def print_hero_map_win_percentages(hero_name: str, seasons: Optional[List[int]]
     if not validate_time_frame(start_date, end_date):
         raise ValueError("Invalid time frame - start date must be before end date")
 
-    with sqlite3.connect(config.DATABASE_NAME) as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT m.date, m.map, m.result, mh.play_percentage
-            FROM matches m
-            JOIN match_heroes mh ON m.id = mh.match_id
-            WHERE mh.hero_name = ?
-        ''', (hero_name,))
-        rows = cursor.fetchall()
+    predicate, params = build_date_filters(start_date, end_date, seasons, column='m.date')
+    query = _SQL_HERO_MAP_WEIGHTED
+    if predicate:
+        query += ' AND ' + predicate
+    query += ' GROUP BY m.map'
 
-    filtered_rows = filter_matches_by_time_and_season(rows, start_date, end_date, seasons)
+    with _get_read_conn() as conn:
+        cursor = conn.execute(query, [hero_name] + params)
+        grouped = cursor.fetchall()
 
     title = f"Map Win Percentages for {hero_name}"
     if seasons:
@@ -274,27 +362,16 @@ def print_hero_map_win_percentages(hero_name: str, seasons: Optional[List[int]]
     output.append(f"{'Map':<25} | {'Played':>7} | {'Wins':>6} | {'Losses':>7} | {'Draws':>7} | {'Win %':>6}\n")
     output.append("-" * 70 + "\n")
 
-    map_stats = {}
-
-    for row in filtered_rows:
-        map_name = row['map']
-        if map_name not in map_stats:
-            map_stats[map_name] = {'wins': 0, 'losses': 0, 'draws': 0}
-
-        # Calculate weighted contribution based on play percentage
-        weight = row['play_percentage'] / 100.0
-
-        if row['result'] == 'VICTORY':
-            map_stats[map_name]['wins'] += weight
-        elif row['result'] == 'DEFEAT':
-            map_stats[map_name]['losses'] += weight
-        elif row['result'] == 'DRAW':
-            map_stats[map_name]['draws'] += weight
+    map_stats = {row['map']: {'wins': row['wins'], 'losses': row['losses'], 'draws': row['draws']}
+                 for row in grouped}
 
     valid_maps = []
+    excluded_count = 0
     for map_name, stats in map_stats.items():
         total_played = stats['wins'] + stats['losses'] + stats['draws']
-        if total_played >= min_matches and (stats['wins'] + stats['losses']) > 0:
+        if total_played < min_matches:
+            excluded_count += 1
+        elif (stats['wins'] + stats['losses']) > 0:
             win_percent = (stats['wins'] / (stats['wins'] + stats['losses'])) * 100
             valid_maps.append((map_name, stats, win_percent))
 
@@ -302,19 +379,11 @@ def print_hero_map_win_percentages(hero_name: str, seasons: Optional[List[int]]
 
     for map_name, stats, win_percent in valid_maps:
         total_played = stats['wins'] + stats['losses'] + stats['draws']
-        output.append(
-            f"{map_name:<25} | "
-            f"{total_played:>7.1f} | "
-            f"{stats['wins']:>6.1f} | "
-            f"{stats['losses']:>7.1f} | "
-            f"{stats['draws']:>7.1f} | "
-            f"{win_percent:>5.1f}%\n"
-        )
-
-    excluded = [m for m in map_stats
-                if (map_stats[m]['wins'] + map_stats[m]['losses'] + map_stats[m]['draws']) < min_matches]
-    if excluded:
-        output.append(f"\nNote: Excluded {len(excluded)} maps with fewer than {min_matches} matches\n")
+        output.append(_WEIGHTED_MAP_ROW_FMT(map_name, total_played, stats['wins'],
+                                            stats['losses'], stats['draws'], win_percent))
+
+    if excluded_count:
+        output.append(f"\nNote: Excluded {excluded_count} maps with fewer than {min_matches} matches\n")
 
     return "".join(output) if valid_maps else f"\nNo data found for {hero_name} with the current filters\n"
 
@@ -328,18 +397,15 @@ def print_map_hero_win_percentages(map_name: str, seasons: Optional[List[int]] =
     if not validate_time_frame(start_date, end_date):
         raise ValueError("Invalid time frame - start date must be before end date")
 
-    with sqlite3.connect(config.DATABASE_NAME) as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT m.date, m.result, mh.hero_name, mh.play_percentage
-            FROM matches m
-            JOIN match_heroes mh ON m.id = mh.match_id
-            WHERE m.map = ?
-        ''', (map_name,))
-        rows = cursor.fetchall()
+    predicate, params = build_date_filters(start_date, end_date, seasons, column='m.date')
+    query = _SQL_HERO_WEIGHTED + ' WHERE m.map = ?'
+    if predicate:
+        query += ' AND ' + predicate
+    query += ' GROUP BY mh.hero_name'
 
-    filtered_rows = filter_matches_by_time_and_season(rows, start_date, end_date, seasons)
+    with _get_read_conn() as conn:
+        cursor = conn.execute(query, [map_name] + params)
+        grouped = cursor.fetchall()
 
     title = f"Hero Win Percentages on {map_name}"
     if seasons:
@@ -354,83 +420,58 @@ def print_map_hero_win_percentages(map_name: str, seasons: Optional[List[int]] =
     output.append(f"{'Hero':<20} | {'Matches':>8} | {'Weighted Wins':>14} | {'Weighted Losses':>16} | {'Win %':>6}\n")
     output.append("-" * 90 + "\n")
 
-    hero_stats = {}
-
-    for row in filtered_rows:
-        hero = row['hero_name']
-        if hero not in hero_stats:
-            hero_stats[hero] = {
-                'weighted_wins': 0.0,
-                'weighted_losses': 0.0,
-                'matches': 0
-            }
-
-        # Calculate weighted contribution based on play percentage
-        weight = row['play_percentage'] / 100.0
-        hero_stats[hero]['matches'] += 1
-
-        if row['result'] == 'VICTORY':
-            hero_stats[hero]['weighted_wins'] += weight
-        elif row['result'] == 'DEFEAT':
-            hero_stats[hero]['weighted_losses'] += weight
+    hero_stats = {row['hero_name']: {'weighted_wins': row['weighted_wins'],
+                                     'weighted_losses': row['weighted_losses'],
+                                     'matches': row['matches']}
+                  for row in grouped}
 
     valid_heroes = []
+    excluded_count = 0
     for hero, stats in hero_stats.items():
         total_weighted = stats['weighted_wins'] + stats['weighted_losses']
-        if stats['matches'] >= min_matches and total_weighted > 0:
+        if stats['matches'] < min_matches:
+            excluded_count += 1
+        elif total_weighted > 0:
             win_percent = (stats['weighted_wins'] / total_weighted) * 100
             valid_heroes.append((hero, stats, win_percent))
 
     valid_heroes.sort(key=lambda x: x[2], reverse=True)
 
     for hero, stats, win_percent in valid_heroes:
-        output.append(
-            f"{hero:<20} | "
-            f"{stats['matches']:>8} | "
-            f"{stats['weighted_wins']:>14.1f} | "
-            f"{stats['weighted_losses']:>16.1f} | "
-            f"{win_percent:>5.1f}%\n"
-        )
-
-    excluded = [h for h in hero_stats
-                if hero_stats[h]['matches'] < min_matches]
-    if excluded:
-        output.append(f"\nNote: Excluded {len(excluded)} heroes with fewer than {min_matches} matches\n")
+        output.append(_HERO_ROW_FMT(hero, stats['matches'], stats['weighted_wins'],
+                                    stats['weighted_losses'], win_percent))
+
+    if excluded_count:
+        output.append(f"\nNote: Excluded {excluded_count} heroes with fewer than {min_matches} matches\n")
 
     return "".join(output) if valid_heroes else f"\nNo data found for {map_name} with the current filters\n"
 
 
 def print_all_matches_by_season(seasons: Optional[List[int]] = None, start_date=None, end_date=None):
     """List all matches with hero data (sorted by percentage) using a single JOIN query"""
-    output = []
     validate_seasons_param(seasons)
 
     if not validate_time_frame(start_date, end_date):
         raise ValueError("Invalid time frame - start date must be before end date")
 
-    with sqlite3.connect(config.DATABASE_NAME) as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        # Get all matches with their heroes sorted by percentage
-        cursor.execute('''
-            SELECT 
-                m.id, m.date, m.map, m.result, m.length_sec,
-                (
-                    SELECT GROUP_CONCAT(hero_data, ', ')
-                    FROM (
-                        SELECT 
-                            hero_name || ' (' || play_percentage || '%)' as hero_data
-                        FROM match_heroes 
-                        WHERE match_id = m.id
-                        ORDER BY play_percentage DESC
-                    )
-                ) AS heroes
-            FROM matches m
-            ORDER BY m.date DESC
-        ''')
-        rows = cursor.fetchall()
-
-    filtered_rows = filter_matches_by_time_and_season(rows, start_date, end_date, seasons)
+    predicate, params = build_date_filters(start_date, end_date, seasons, column='m.date')
+    # One flat join instead of a correlated GROUP_CONCAT subquery per match;
+    # rows arrive grouped by match with heroes sorted by play percentage
+    query = '''
+        SELECT m.id, m.date, m.map, m.result, m.length_sec,
+               mh.hero_name, mh.play_percentage
+        FROM matches m
+        LEFT JOIN match_heroes mh ON mh.match_id = m.id
+    '''
+    if predicate:
+        query += ' WHERE ' + predicate
+    query += ' ORDER BY m.date DESC, m.id, mh.play_percentage DESC'
+
+    with _get_read_conn() as conn:
+        # Stream the cursor rather than materializing every joined row;
+        # sqlite3 hands batches to groupby as they are consumed, keeping
+        # peak memory proportional to one match rather than the result set
+        joined_cursor = conn.execute(query, params)
 
     title = "Overwatch Match Database"
     if seasons:
@@ -440,27 +481,44 @@ def print_all_matches_by_season(seasons: Optional[List[int]] = None, start_date=
             title += f" (Seasons {', '.join(map(str, sorted(seasons)))})"
     if start_date or end_date:
         title += f" ({start_date or 'Start'} to {end_date or 'Now'})"
-    output.append(f"\n{title} - {len(filtered_rows)} Matches\n")
-    output.append("-" * 110 + "\n")
-    output.append(f"{'Date':<12} | {'Time':<8} | {'Map':<22} | {'Result':<8} | {'Duration':<9} | {'Heroes'}\n")
-    output.append("-" * 110 + "\n")
-
-    for match in filtered_rows:
-        utc_time = datetime.strptime(match['date'], config.DATE_OUTPUT_FORMAT).replace(tzinfo=config.UTC_TIMEZONE)
-        local_time = utc_time.astimezone(config.LOCAL_TIMEZONE)
+    # Hoist the per-row conversion state; fromisoformat parses the default
+    # 'YYYY-MM-DD HH:MM' layout about twice as fast as strptime
+    iso_dates = config.DATE_OUTPUT_FORMAT == '%Y-%m-%d %H:%M'
+    utc_tz = config.UTC_TIMEZONE
+    local_tz = config.LOCAL_TIMEZONE
+
+    # Group the joined rows back into one rendered line per match; the body
+    # grows in a single StringIO buffer instead of a list of row strings
+    body = io.StringIO()
+    match_count = 0
+    for _, group in itertools.groupby(joined_cursor, key=lambda r: r['id']):
+        match_rows = list(group)
+        match = match_rows[0]
+        heroes = ", ".join(f"{r['hero_name']} ({r['play_percentage']}%)"
+                           for r in match_rows if r['hero_name'] is not None)
+
+        if iso_dates:
+            utc_time = datetime.fromisoformat(match['date']).replace(tzinfo=utc_tz)
+        else:
+            utc_time = datetime.strptime(match['date'], config.DATE_OUTPUT_FORMAT).replace(tzinfo=utc_tz)
+        local_time = utc_time.astimezone(local_tz)
         minutes, seconds = divmod(match['length_sec'], 60)
         duration_str = f"{minutes}m{seconds:02d}s"
 
-        output.append(
-            f"{local_time.strftime('%Y-%m-%d'):<12} | "
-            f"{local_time.strftime('%H:%M'):<8} | "
-            f"{match['map']:<22} | "
-            f"{match['result']:<8} | "
-            f"{duration_str:>9} | "
-            f"{match['heroes'] if match['heroes'] else 'No hero data'}\n"
-        )
+        match_count += 1
+        body.write(_MATCH_ROW_FMT(
+            local_time.strftime('%Y-%m-%d'), local_time.strftime('%H:%M'),
+            match['map'], match['result'], duration_str,
+            heroes if heroes else 'No hero data'))
 
-    return "".join(output)
+    buf = io.StringIO()
+    buf.write(f"\n{title} - {match_count} Matches\n")
+    buf.write("-" * 110 + "\n")
+    buf.write(f"{'Date':<12} | {'Time':<8} | {'Map':<22} | {'Result':<8} | {'Duration':<9} | {'Heroes'}\n")
+    buf.write("-" * 110 + "\n")
+    buf.write(body.getvalue())
+
+    return buf.getvalue()
 
 
 def print_summary_stats_by_season(seasons: Optional[List[int]] = None, start_date=None, end_date=None):
@@ -471,9 +529,7 @@ def print_summary_stats_by_season(seasons: Optional[List[int]] = None, start_dat
     if not validate_time_frame(start_date, end_date):
         raise ValueError("Invalid time frame - start date must be before end date")
 
-    with sqlite3.connect(config.DATABASE_NAME) as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+    with _get_read_conn() as conn:
         title = "Summary Statistics"
         if seasons:
             if len(seasons) == 1:
@@ -484,30 +540,28 @@ def print_summary_stats_by_season(seasons: Optional[List[int]] = None, start_dat
             title += f" ({start_date or 'Start'} to {end_date or 'Now'})"
         output.append(f"\n{title}:\n")
 
-        cursor.execute('SELECT date, result, map FROM matches')
-        rows = cursor.fetchall()
-
-    filtered_rows = filter_matches_by_time_and_season(rows, start_date, end_date, seasons)
+        # Three tiny aggregates instead of transferring every match row
+        predicate, params = build_date_filters(start_date, end_date, seasons)
+        where_sql = (' WHERE ' + predicate) if predicate else ''
 
-    output.append(f"Total matches: {len(filtered_rows)}\n")
+        total = conn.execute('SELECT COUNT(*) FROM matches' + where_sql,
+                             params).fetchone()[0]
+        result_counts = conn.execute(
+            'SELECT result, COUNT(*) AS count FROM matches' + where_sql +
+            ' GROUP BY result ORDER BY count DESC, result', params).fetchall()
+        top_maps = conn.execute(
+            'SELECT map, COUNT(*) AS count FROM matches' + where_sql +
+            ' GROUP BY map ORDER BY count DESC, map LIMIT 5', params).fetchall()
 
-    results = {'VICTORY': 0, 'DEFEAT': 0, 'DRAW': 0}
-    for row in filtered_rows:
-        results[row['result']] += 1  # Change from row[1] to row['result']
+    output.append(f"Total matches: {total}\n")
 
     output.append("\nResults:\n")
-    for result, count in sorted(results.items(), key=lambda x: x[1], reverse=True):
-        if count > 0:
-            output.append(f"- {result}: {count}\n")
-
-    map_counts = {}
-    for row in filtered_rows:
-        map_name = row['map']  # Change from row[2] to row['map']
-        map_counts[map_name] = map_counts.get(map_name, 0) + 1
+    for row in result_counts:
+        output.append(f"- {row['result']}: {row['count']}\n")
 
     output.append("\nTop 5 Maps:\n")
-    for map_name, count in sorted(map_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
-        output.append(f"- {map_name}: {count} matches\n")
+    for row in top_maps:
+        output.append(f"- {row['map']}: {row['count']} matches\n")
 
     return "".join(output)
 
@@ -520,9 +574,7 @@ def print_map_frequency_stats_by_season(seasons: Optional[List[int]] = None, sta
     if not validate_time_frame(start_date, end_date):
         raise ValueError("Invalid time frame - start date must be before end date")
 
-    with sqlite3.connect(config.DATABASE_NAME) as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+    with _get_read_conn() as conn:
         title = "Map Frequency and Win Percentages"
         if seasons:
             if len(seasons) == 1:
@@ -536,26 +588,16 @@ def print_map_frequency_stats_by_season(seasons: Optional[List[int]] = None, sta
         output.append(f"{'Map':<25} | {'Played':>7} | {'Win %':>6} | {'Wins':>6} | {'Losses':>7} | {'Draws':>7}\n")
         output.append("-" * 70 + "\n")
 
-        cursor.execute('SELECT date, map, result FROM matches')
-        rows = cursor.fetchall()
-
-    filtered_rows = filter_matches_by_time_and_season(rows, start_date, end_date, seasons)
+        predicate, params = build_date_filters(start_date, end_date, seasons)
+        query = _SQL_MAP_RESULT_COUNTS
+        if predicate:
+            query += ' WHERE ' + predicate
+        query += ' GROUP BY map'
+        cursor = conn.execute(query, params)
+        grouped = cursor.fetchall()
 
-    map_stats = {}
-
-    for row in filtered_rows:
-        map_name = row['map']  # Change from row[1] to row['map']
-        result = row['result']  # Change from row[2] to row['result']
-
-        if map_name not in map_stats:
-            map_stats[map_name] = {'wins': 0, 'losses': 0, 'draws': 0}
-
-        if result == 'VICTORY':
-            map_stats[map_name]['wins'] += 1
-        elif result == 'DEFEAT':
-            map_stats[map_name]['losses'] += 1
-        elif result == 'DRAW':
-            map_stats[map_name]['draws'] += 1
+    map_stats = {row['map']: {'wins': row['wins'], 'losses': row['losses'], 'draws': row['draws']}
+                 for row in grouped}
 
     # Calculate stats for each map
     map_data = []
@@ -568,14 +610,8 @@ def print_map_frequency_stats_by_season(seasons: Optional[List[int]] = None, sta
     map_data.sort(key=lambda x: x[1], reverse=True)
 
     for map_name, total_played, win_percent, wins, losses, draws in map_data:
-        output.append(
-            f"{map_name:<25} | "
-            f"{total_played:>7} | "
-            f"{win_percent:>5.1f}% | "
-            f"{wins:>6} | "
-            f"{losses:>7} | "
-            f"{draws:>7}\n"
-        )
+        output.append(_FREQ_ROW_FMT(map_name, total_played, win_percent,
+                                    wins, losses, draws))
 
     return "".join(output)
 
@@ -588,9 +624,7 @@ def print_game_mode_stats_by_season(seasons: Optional[List[int]] = None, start_d
     if not validate_time_frame(start_date, end_date):
         raise ValueError("Invalid time frame - start date must be before end date")
 
-    with sqlite3.connect(config.DATABASE_NAME) as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+    with _get_read_conn() as conn:
         title = "Win Percentage by Game Mode"
         if seasons:
             if len(seasons) == 1:
@@ -601,30 +635,27 @@ def print_game_mode_stats_by_season(seasons: Optional[List[int]] = None, start_d
             title += f" ({start_date or 'Start'} to {end_date or 'Now'})"
         output.append(f"\n{title}:\n")
 
-        MAP_MODES = {}
-        for mode, maps in GAME_MODES.items():
-            for map_name in maps:
-                MAP_MODES[map_name] = mode
-
-        cursor.execute('SELECT date, map, result, length_sec FROM matches')
-        rows = cursor.fetchall()
-
-    filtered_rows = filter_matches_by_time_and_season(rows, start_date, end_date, seasons)
+        predicate, params = build_date_filters(start_date, end_date, seasons)
+        query = _SQL_MODE_MAP_COUNTS
+        if predicate:
+            query += ' WHERE ' + predicate
+        query += ' GROUP BY map'
+        cursor = conn.execute(query, params)
+        grouped = cursor.fetchall()
 
     mode_stats = {}
     for mode in GAME_MODES:
         mode_stats[mode] = {'matches': 0, 'wins': 0, 'losses': 0, 'total_time': 0}
 
-    for row in filtered_rows:
-        map_name = row['map']  # Change from row[1] to row['map']
-        if map_name in MAP_MODES:
-            mode = MAP_MODES[map_name]
-            mode_stats[mode]['matches'] += 1
-            mode_stats[mode]['total_time'] += row['length_sec']  # Change from row[3] to row['length_sec']
-            if row['result'] == 'VICTORY':  # Change from row[2] to row['result']
-                mode_stats[mode]['wins'] += 1
-            elif row['result'] == 'DEFEAT':  # Change from row[2] to row['result']
-                mode_stats[mode]['losses'] += 1
+    # Fold the per-map aggregates into their game modes
+    for row in grouped:
+        mode = MAP_MODES.get(row['map'])
+        if mode:
+            stats = mode_stats[mode]
+            stats['matches'] += row['matches']
+            stats['total_time'] += row['total_time']
+            stats['wins'] += row['wins']
+            stats['losses'] += row['losses']
 
     output.append("-" * 90 + "\n")
     output.append(
@@ -637,23 +668,17 @@ def print_game_mode_stats_by_season(seasons: Optional[List[int]] = None, start_d
             avg_time = (stats['total_time'] / stats['matches']) / 60
             sample_maps = ", ".join(GAME_MODES[mode][:3])
 
-            output.append(
-                f"{mode:<15} | "
-                f"{stats['matches']:>8} | "
-                f"{stats['wins']:>6} | "
-                f"{stats['losses']:>7} | "
-                f"{win_rate:>5.1f}% | "
-                f"{avg_time:>7.1f}m | "
-                f"{sample_maps}\n"
-            )
+            output.append(_MODE_ROW_FMT(mode, stats['matches'], stats['wins'],
+                                        stats['losses'], win_rate, avg_time,
+                                        sample_maps))
 
     return "".join(output)
 
 
-# Lambda functions for simplified calling
-print_win_percentages = lambda seasons=None, min_matches=1, start_date=None, end_date=None: print_win_percentages_by_season(seasons, min_matches, start_date, end_date)
-print_all_matches = lambda seasons=None, start_date=None, end_date=None: print_all_matches_by_season(seasons, start_date, end_date)
-print_summary_stats = lambda seasons=None, start_date=None, end_date=None: print_summary_stats_by_season(seasons, start_date, end_date)
-print_map_frequency_stats = lambda seasons=None, start_date=None, end_date=None: print_map_frequency_stats_by_season(seasons, start_date, end_date)
-print_game_mode_stats = lambda seasons=None, start_date=None, end_date=None: print_game_mode_stats_by_season(seasons, start_date, end_date)
-print_hero_win_percentages = lambda seasons=None, min_matches=1, start_date=None, end_date=None: print_hero_win_percentages_by_season(seasons, min_matches, start_date, end_date)
\ No newline at end of file
+# Short aliases for simplified calling
+print_win_percentages = print_win_percentages_by_season
+print_all_matches = print_all_matches_by_season
+print_summary_stats = print_summary_stats_by_season
+print_map_frequency_stats = print_map_frequency_stats_by_season
+print_game_mode_stats = print_game_mode_stats_by_season
+print_hero_win_percentages = print_hero_win_percentages_by_season
\ No newline at end of file
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the project root importable for every test module in one place
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
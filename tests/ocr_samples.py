@@ -0,0 +1,27 @@
+"""Shared, lazily-built cache of the test screenshots and their OCR text.
+
+Multiple test modules exercise the same three screenshots; caching the
+decoded image and the full-frame Tesseract pass here means one OCR per
+file per test session no matter how many modules consume them.
+"""
+import functools
+
+from PIL import Image
+import pytesseract
+
+import config
+
+SCREENSHOT_PATHS = {
+    1: "tests/test_screenshots/testingscreenshot1.jpg",
+    2: "tests/test_screenshots/testingscreenshot2.jpg",
+    3: "tests/test_screenshots/testingscreenshot3.jpg",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_sample(number):
+    """Return (decoded image, full-frame OCR text) for a test screenshot"""
+    pytesseract.pytesseract.tesseract_cmd = config.TESSERACT_CMD
+    image = Image.open(SCREENSHOT_PATHS[number])
+    image.load()  # decode the JPEG once; extractors then crop freely
+    return image, pytesseract.image_to_string(image)
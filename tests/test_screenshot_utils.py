@@ -1,24 +1,23 @@
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from PIL import Image
-import pytesseract
 from screenshot_utils import extract_datetime, extract_game_length, determine_result, extract_map_name, extract_hero_data
 import config
-import map_categories 
+import map_categories
+from ocr_samples import SCREENSHOT_PATHS, get_sample
 
 import unittest
 
-pytesseract.pytesseract.tesseract_cmd = config.TESSERACT_CMD
 
 class TestStatsFunctions(unittest.TestCase):
     """Unit tests for screenshot_utils module."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Pull each screenshot through the session-wide OCR cache; any other
+        module using the same samples reuses these results."""
+        cls.samples = {number: get_sample(number) for number in SCREENSHOT_PATHS}
+
     def test_testscreenshot1(self):
         """Test the screenshot_utils module with a sample screenshot."""
-        image = Image.open("tests/test_screenshots/testingscreenshot1.jpg")
-        text = pytesseract.image_to_string(image)
+        image, text = self.samples[1]
 
         self.assertEqual(extract_datetime(text, config.DATE_INPUT_FORMAT,config.DATE_OUTPUT_FORMAT), "2025-06-26 03:00")
         self.assertEqual(extract_game_length(image, text), (923, '15:23', None))
@@ -28,8 +27,7 @@ class TestStatsFunctions(unittest.TestCase):
 
     def test_testscreenshot2(self):
         """Test the screenshot_utils module with a sample screenshot."""
-        image = Image.open("tests/test_screenshots/testingscreenshot2.jpg")
-        text = pytesseract.image_to_string(image)
+        image, text = self.samples[2]
 
         self.assertEqual(extract_datetime(text, config.DATE_INPUT_FORMAT,config.DATE_OUTPUT_FORMAT), "2025-05-08 05:44")
         self.assertEqual(extract_game_length(image, text), (937, '15:37', None))
@@ -39,8 +37,7 @@ class TestStatsFunctions(unittest.TestCase):
 
     def test_testscreenshot3(self):
         """Test the screenshot_utils module with a sample screenshot."""
-        image = Image.open("tests/test_screenshots/testingscreenshot3.jpg")
-        text = pytesseract.image_to_string(image)
+        image, text = self.samples[3]
 
         self.assertEqual(extract_datetime(text, config.DATE_INPUT_FORMAT,config.DATE_OUTPUT_FORMAT), "2025-07-13 17:58")
         self.assertEqual(extract_game_length(image, text), (465, '7:45', None))
@@ -51,5 +48,3 @@ class TestStatsFunctions(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
-
-
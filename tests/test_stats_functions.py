@@ -1,7 +1,3 @@
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import unittest
 
 class TestStatsFunctions(unittest.TestCase):
@@ -10,12 +6,15 @@ class TestStatsFunctions(unittest.TestCase):
     def test_validate_seasons_param_type_error(self):
         """Test that validate_seasons_param raises TypeError for bad input."""
         from stats_functions import validate_seasons_param
-        with self.assertRaises(TypeError):
-            validate_seasons_param(18)  # Not a list  # type: ignore
-            validate_seasons_param("18")  # Not a list  # type: ignore
-            validate_seasons_param(None) # Not a list  # type: ignore
-            validate_seasons_param(18.5)  # Not a list  # type: ignore
-            validate_seasons_param([])  # Empty list is valid
+        # The old single assertRaises block stopped at the first call, so
+        # only one case was ever exercised; subTest runs them all
+        for bad in (18, "18", 18.5, [16, "17"]):
+            with self.subTest(bad=bad), self.assertRaises(TypeError):
+                validate_seasons_param(bad)  # type: ignore
+
+        # None (no filter) and an empty list are accepted
+        validate_seasons_param(None)
+        validate_seasons_param([])
 
     def test_validate_date_string(self):
         """Test date string validation."""